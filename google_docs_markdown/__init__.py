@@ -8,20 +8,44 @@ This package provides:
 - MarkdownDeserializer: Converts Markdown text to Google Docs API requests
 - GoogleDocsClient: High-level client returning typed Pydantic models
 - GoogleDocsTransport: Low-level transport returning raw API dicts
+
+Public names are imported lazily on first access so that importing a submodule
+(e.g. the CLI) does not pull in the Google API client, Pydantic models, and
+Markdown parser until they are actually needed.
 """
 
-from google_docs_markdown.client import GoogleDocsClient
-from google_docs_markdown.downloader import (
-    Downloader,
-    FileConflictError,
-    TabSummary,
-    find_stale_files,
-    remove_empty_dirs,
-)
-from google_docs_markdown.markdown_deserializer import MarkdownDeserializer
-from google_docs_markdown.markdown_serializer import MarkdownSerializer
-from google_docs_markdown.transport import GoogleDocsTransport, TabInfo
-from google_docs_markdown.uploader import Uploader
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from google_docs_markdown.client import GoogleDocsClient
+    from google_docs_markdown.downloader import (
+        Downloader,
+        FileConflictError,
+        TabSummary,
+        find_stale_files,
+        remove_empty_dirs,
+    )
+    from google_docs_markdown.markdown_deserializer import MarkdownDeserializer
+    from google_docs_markdown.markdown_serializer import MarkdownSerializer
+    from google_docs_markdown.transport import GoogleDocsTransport, TabInfo
+    from google_docs_markdown.uploader import Uploader
+
+_LAZY_IMPORTS = {
+    "Downloader": "google_docs_markdown.downloader",
+    "FileConflictError": "google_docs_markdown.downloader",
+    "GoogleDocsClient": "google_docs_markdown.client",
+    "GoogleDocsTransport": "google_docs_markdown.transport",
+    "MarkdownDeserializer": "google_docs_markdown.markdown_deserializer",
+    "MarkdownSerializer": "google_docs_markdown.markdown_serializer",
+    "TabInfo": "google_docs_markdown.transport",
+    "TabSummary": "google_docs_markdown.downloader",
+    "Uploader": "google_docs_markdown.uploader",
+    "find_stale_files": "google_docs_markdown.downloader",
+    "remove_empty_dirs": "google_docs_markdown.downloader",
+}
 
 __all__ = [
     "Downloader",
@@ -38,3 +62,18 @@ __all__ = [
 ]
 
 __version__ = "0.3.0"
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names from their submodules on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported public names."""
+    return sorted([*globals(), *__all__])
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Annotated
 import typer
 
 if TYPE_CHECKING:
+    from google_docs_markdown.downloader import Downloader
     from google_docs_markdown.uploader import Uploader
 
 app = typer.Typer(
@@ -84,7 +85,6 @@ def download(
     """Download a Google Doc as Markdown."""
     from google_docs_markdown.downloader import (
         Downloader,
-        FileConflictError,
         find_stale_files,
         remove_empty_dirs,
     )
@@ -95,35 +95,124 @@ def download(
 
     try:
         prefetched = dl._fetch_and_serialize(document_url, tab_names=tabs or None)
-        written = dl.download_to_files(
+        written = _write_prefetched(dl, document_url, prefetched, output, tabs or None, force=force)
+    except typer.Abort:
+        raise
+    except Exception as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    for tab_path, file_path in written.items():
+        typer.echo(f"  {tab_path} -> {file_path}")
+    typer.echo(f"Downloaded {len(written)} tab(s).")
+
+    _prompt_stale_cleanup(written, find_stale_files, remove_empty_dirs, force=force)
+
+
+@app.command("download-many")
+def download_many(
+    document_urls: Annotated[list[str], typer.Argument(help="Google Doc URLs or document IDs")],
+    output: Annotated[
+        str | None,
+        typer.Option(
+            "-o",
+            "--output",
+            help=(
+                "Parent directory for output (a subdirectory named after each"
+                " document title is created inside it, with the document ID appended"
+                " when titles collide; defaults to current directory)"
+            ),
+        ),
+    ] = None,
+    force: Annotated[
+        bool,
+        typer.Option("-f", "--force", help="Overwrite existing files and delete stale files without prompting"),
+    ] = False,
+    workers: Annotated[
+        int | None,
+        typer.Option("-w", "--workers", min=1, help="Maximum concurrent downloads (defaults to 8)"),
+    ] = None,
+) -> None:
+    """Download several Google Docs as Markdown, fetching them concurrently."""
+    from google_docs_markdown.downloader import (
+        Downloader,
+        find_stale_files,
+        remove_empty_dirs,
+    )
+    from google_docs_markdown.transport import DEFAULT_MAX_WORKERS
+
+    dl = Downloader()
+    typer.echo(f"Downloading {len(document_urls)} document(s)...")
+
+    try:
+        written_by_document = dl.download_many(
+            document_urls,
+            output,
+            overwrite=force,
+            max_workers=workers or DEFAULT_MAX_WORKERS,
+            confirm_overwrite=_confirm_overwrite,
+        )
+    except typer.Abort:
+        raise
+    except Exception as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    total = 0
+    for written in written_by_document.values():
+        if not written:
+            continue
+        tab_path, file_path = next(iter(written.items()))
+        # Tab paths nest one directory per "/" below the document directory
+        typer.echo(f"{file_path.parents[tab_path.count('/')].name}:")
+        for tab_path, file_path in written.items():
+            typer.echo(f"  {tab_path} -> {file_path}")
+        total += len(written)
+
+        _prompt_stale_cleanup(written, find_stale_files, remove_empty_dirs, force=force)
+
+    typer.echo(f"Downloaded {total} tab(s) from {len(written_by_document)} document(s).")
+
+
+def _confirm_overwrite(existing_paths: list[Path]) -> bool:
+    """List files that would be overwritten and ask before replacing them; abort if declined."""
+    typer.echo("The following files already exist:")
+    for p in existing_paths:
+        typer.echo(f"  {p}")
+    if not typer.confirm("Overwrite?"):
+        raise typer.Abort()
+    return True
+
+
+def _write_prefetched(
+    dl: Downloader,
+    document_url: str,
+    prefetched: tuple[str, dict[str, str]],
+    output: str | None,
+    tabs: list[str] | None,
+    *,
+    force: bool,
+) -> dict[str, Path]:
+    """Write an already serialized document, prompting before overwriting files."""
+    from google_docs_markdown.downloader import FileConflictError
+
+    try:
+        return dl.download_to_files(
             document_url,
             output_dir=output,
-            tab_names=tabs or None,
+            tab_names=tabs,
             overwrite=force,
             _prefetched=prefetched,
         )
     except FileConflictError as exc:
-        typer.echo("The following files already exist:")
-        for p in exc.existing_paths:
-            typer.echo(f"  {p}")
-        if not typer.confirm("Overwrite?"):
-            raise typer.Abort() from exc
-        written = dl.download_to_files(
+        _confirm_overwrite(exc.existing_paths)
+        return dl.download_to_files(
             document_url,
             output_dir=output,
-            tab_names=tabs or None,
+            tab_names=tabs,
             overwrite=True,
             _prefetched=prefetched,
         )
-    except Exception as exc:
-        typer.echo(f"Error: {exc}", err=True)
-        raise typer.Exit(code=1) from exc
-
-    for tab_path, file_path in written.items():
-        typer.echo(f"  {tab_path} -> {file_path}")
-    typer.echo(f"Downloaded {len(written)} tab(s).")
-
-    _prompt_stale_cleanup(written, find_stale_files, remove_empty_dirs, force=force)
 
 
 @app.command("list-tabs")
@@ -10,7 +10,7 @@ from __future__ import annotations
 from google.auth.credentials import Credentials
 
 from google_docs_markdown.models import Document, Request, Response
-from google_docs_markdown.transport import GoogleDocsTransport
+from google_docs_markdown.transport import DEFAULT_MAX_WORKERS, GoogleDocsTransport
 
 
 class GoogleDocsClient:
@@ -43,12 +43,13 @@ class GoogleDocsClient:
         """Delegate to GoogleDocsTransport.extract_document_id."""
         return GoogleDocsTransport.extract_document_id(url_or_id)
 
-    def get_document(self, document_id: str) -> Document:
+    def get_document(self, document_id: str, *, fields: str | None = None) -> Document:
         """
         Retrieve a document from Google Docs API as a Pydantic model.
 
         Args:
             document_id: The document ID or URL
+            fields: Optional partial-response field mask; unselected fields are None
 
         Returns:
             Document Pydantic model
@@ -57,9 +58,30 @@ class GoogleDocsClient:
             HttpError: If the API request fails
             ValueError: If document_id is invalid
         """
-        raw = self.transport.get_document(document_id)
+        raw = self.transport.get_document(document_id, fields=fields)
         return Document.model_validate(raw)
 
+    def get_documents_parallel(
+        self,
+        document_ids: list[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        *,
+        fields: str | None = None,
+    ) -> dict[str, Document]:
+        """
+        Retrieve several documents concurrently as Pydantic models.
+
+        Args:
+            document_ids: Document IDs or URLs
+            max_workers: Maximum number of concurrent requests
+            fields: Optional partial-response field mask applied to every request
+
+        Returns:
+            Dict mapping each document ID to its Document Pydantic model
+        """
+        raw = self.transport.get_documents_parallel(document_ids, max_workers=max_workers, fields=fields)
+        return {doc_id: Document.model_validate(doc) for doc_id, doc in raw.items()}
+
     def create_document(self, document: Document) -> Document:
         """
         Create a new blank document.
@@ -88,3 +110,33 @@ class GoogleDocsClient:
         raw_requests = [r.model_dump(exclude_none=True) for r in requests]
         raw_responses = self.transport.batch_update(document_id, raw_requests)  # type: ignore[arg-type]
         return [Response.model_validate(r) for r in raw_responses]
+
+    def batch_get_documents(self, document_ids: list[str]) -> dict[str, Document]:
+        """
+        Retrieve several documents in batched HTTP requests as Pydantic models.
+
+        Args:
+            document_ids: Document IDs or URLs
+
+        Returns:
+            Dict mapping each document ID to its Document Pydantic model
+        """
+        raw = self.transport.batch_get_documents(document_ids)
+        return {doc_id: Document.model_validate(doc) for doc_id, doc in raw.items()}
+
+    def batch_update_documents(self, requests_by_document: dict[str, list[Request]]) -> dict[str, list[Response]]:
+        """
+        Execute batch updates against several documents in batched HTTP requests.
+
+        Args:
+            requests_by_document: Mapping of document ID to Request Pydantic models
+
+        Returns:
+            Dict mapping each document ID to its list of Response Pydantic models
+        """
+        raw_requests = {
+            doc_id: [r.model_dump(exclude_none=True) for r in requests]
+            for doc_id, requests in requests_by_document.items()
+        }
+        raw_responses = self.transport.batch_update_documents(raw_requests)  # type: ignore[arg-type]
+        return {doc_id: [Response.model_validate(r) for r in replies] for doc_id, replies in raw_responses.items()}
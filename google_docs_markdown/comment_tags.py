@@ -22,6 +22,7 @@ from __future__ import annotations
 import json
 import re
 from enum import StrEnum
+from functools import lru_cache
 from typing import Any
 
 
@@ -105,6 +106,12 @@ _CLOSE_RE = re.compile(
 )
 
 
+@lru_cache(maxsize=64)
+def _close_re_for(tag_type: str) -> re.Pattern[str]:
+    """Return the compiled closing-tag pattern for *tag_type*."""
+    return re.compile(r"<!--\s*/" + re.escape(tag_type) + r"\s*-->")
+
+
 class ParsedTag:
     """A parsed comment tag extracted from markdown text."""
 
@@ -142,6 +149,9 @@ def parse_tags(text: str) -> list[ParsedTag]:
     outer<!-- /style -->`` — the inner opening tag will be consumed as
     content of the first match.
     """
+    if "<!--" not in text:
+        return []
+
     tags: list[ParsedTag] = []
     used_closes: set[int] = set()
 
@@ -150,10 +160,7 @@ def parse_tags(text: str) -> list[ParsedTag]:
         json_str = open_m.group("json")
         data = json.loads(json_str) if json_str else None
 
-        close_pattern = re.compile(
-            r"<!--\s*/" + re.escape(tag_type) + r"\s*-->",
-        )
-        close_m = close_pattern.search(text, open_m.end())
+        close_m = _close_re_for(tag_type).search(text, open_m.end())
 
         if close_m and close_m.start() not in used_closes:
             used_closes.add(close_m.start())
@@ -6,13 +6,23 @@ each tab to Markdown, and writes the result as a directory of .md files.
 
 from __future__ import annotations
 
+import os
 import re
+import shutil
+import tempfile
+from collections import Counter
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
 from google_docs_markdown.client import GoogleDocsClient
-from google_docs_markdown.markdown_serializer import MarkdownSerializer
-from google_docs_markdown.models.document import Tab
+from google_docs_markdown.markdown_serializer import (
+    DOCUMENT_CONTENT_FIELDS,
+    DOCUMENT_SUMMARY_FIELDS,
+    MarkdownSerializer,
+)
+from google_docs_markdown.models.document import Document, Tab
+from google_docs_markdown.transport import DEFAULT_MAX_WORKERS
 
 
 class FileConflictError(Exception):
@@ -68,7 +78,7 @@ class Downloader:
             Dict mapping tab path (e.g. ``"Tab 1"`` or
             ``"Parent Tab/Child Tab"``) to Markdown content.
         """
-        doc = self._client.get_document(document_id)
+        doc = self._client.get_document(document_id, fields=DOCUMENT_CONTENT_FIELDS)
         result: dict[str, str] = {}
         self._collect_tabs(doc.tabs or [], result, prefix="", tab_filter=tab_names, document_id=doc.documentId)
         return result
@@ -127,7 +137,9 @@ class Downloader:
         for tab_path, markdown in tab_markdowns.items():
             file_path = planned[tab_path]
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(markdown, encoding="utf-8")
+            # Written as pre-encoded bytes: one encode pass, no newline
+            # translation, so files are byte-identical on every platform
+            _atomic_write_bytes(file_path, markdown.encode("utf-8"))
             written[tab_path] = file_path
 
         return written
@@ -144,7 +156,104 @@ class Downloader:
             ``(title, tab_markdowns)`` where *title* is the document title
             and *tab_markdowns* maps tab paths to Markdown content.
         """
-        doc = self._client.get_document(document_id)
+        doc = self._client.get_document(document_id, fields=DOCUMENT_CONTENT_FIELDS)
+        return self._serialize_document(doc, tab_names=tab_names)
+
+    def download_many(
+        self,
+        document_ids: list[str],
+        output_dir: str | Path | None = None,
+        *,
+        overwrite: bool = True,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        confirm_overwrite: Callable[[list[Path]], bool] | None = None,
+    ) -> dict[str, dict[str, Path]]:
+        """Download several documents concurrently and write each to disk.
+
+        All documents are fetched in parallel over one client, then written
+        one after another exactly as :meth:`download_to_files` would. Each
+        document's directory is resolved before anything is written: a
+        document listed twice is written once, and when two titles map to
+        the same directory name (compared case-insensitively), each of those
+        directories gets `` (<document ID>)`` appended, e.g. ``Notes (1AbC...)``.
+
+        Args:
+            document_ids: Google Doc document IDs or URLs.
+            output_dir: Parent directory for output; each document gets its
+                own title-named subdirectory inside it.
+            overwrite: If ``False``, raise :class:`FileConflictError` when a
+                document's target files already exist. The check is made per
+                document, so documents earlier in the list may already have
+                been written.
+            max_workers: Maximum number of concurrent API requests.
+            confirm_overwrite: Called with the existing paths when
+                *overwrite* is ``False`` and a document's files already exist.
+                Returning ``True`` overwrites them; returning ``False`` (or
+                leaving this unset) raises :class:`FileConflictError`.
+
+        Returns:
+            Dict mapping each document ID to its tab-path-to-Path mapping.
+
+        Raises:
+            FileConflictError: If *overwrite* is ``False``, a document's
+                target files already exist, and *confirm_overwrite* does not
+                approve replacing them.
+        """
+        prefetched = self._fetch_and_serialize_many(document_ids, max_workers=max_workers)
+        written: dict[str, dict[str, Path]] = {}
+        for doc_id, result in prefetched.items():
+            try:
+                written[doc_id] = self.download_to_files(doc_id, output_dir, overwrite=overwrite, _prefetched=result)
+            except FileConflictError as exc:
+                if confirm_overwrite is None or not confirm_overwrite(exc.existing_paths):
+                    raise
+                written[doc_id] = self.download_to_files(doc_id, output_dir, overwrite=True, _prefetched=result)
+        return written
+
+    def _fetch_and_serialize_many(
+        self,
+        document_ids: list[str],
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> dict[str, tuple[str, dict[str, str]]]:
+        """Fetch documents in parallel and serialize them without writing to disk.
+
+        Every output directory is resolved here, before anything is written:
+        a document listed twice (e.g. by URL and by ID) is kept once, and
+        documents whose sanitized titles collide get `` (<document ID>)``
+        appended to their title so each directory belongs to one document.
+
+        Returns:
+            Dict mapping each document ID to the ``(title, tab_markdowns)``
+            tuple :meth:`_fetch_and_serialize` would return for it.
+        """
+        docs = self._client.get_documents_parallel(
+            document_ids, max_workers=max_workers, fields=DOCUMENT_CONTENT_FIELDS
+        )
+        serialized: dict[str, tuple[str, dict[str, str]]] = {}
+        resolved_ids: dict[str, str] = {}
+        for doc_id, doc in docs.items():
+            resolved_id = doc.documentId or doc_id
+            if resolved_id in resolved_ids.values():
+                continue
+            resolved_ids[doc_id] = resolved_id
+            serialized[doc_id] = self._serialize_document(doc)
+
+        # Compared case-insensitively: "Notes" and "notes" are one directory
+        # on macOS and Windows
+        dir_counts = Counter(sanitize_filename(title).casefold() for title, _ in serialized.values())
+        for doc_id, (title, tab_markdowns) in serialized.items():
+            if dir_counts[sanitize_filename(title).casefold()] > 1:
+                serialized[doc_id] = (f"{title} ({resolved_ids[doc_id]})", tab_markdowns)
+        return serialized
+
+    def _serialize_document(
+        self,
+        doc: Document,
+        *,
+        tab_names: list[str] | None = None,
+    ) -> tuple[str, dict[str, str]]:
+        """Serialize the tabs of an already fetched document."""
         title = doc.title or "Untitled Document"
         tab_markdowns: dict[str, str] = {}
         self._collect_tabs(doc.tabs or [], tab_markdowns, prefix="", tab_filter=tab_names, document_id=doc.documentId)
@@ -159,7 +268,7 @@ class Downloader:
         Returns:
             The document title, or ``"Untitled Document"`` if unset.
         """
-        doc = self._client.get_document(document_id)
+        doc = self._client.get_document(document_id, fields=DOCUMENT_SUMMARY_FIELDS)
         return doc.title or "Untitled Document"
 
     def get_tabs(self, document_id: str) -> list[TabSummary]:
@@ -172,7 +281,7 @@ class Downloader:
             List of top-level :class:`TabSummary` objects. Each summary
             contains nested ``child_tabs`` for recursive traversal.
         """
-        doc = self._client.get_document(document_id)
+        doc = self._client.get_document(document_id, fields=DOCUMENT_SUMMARY_FIELDS)
         return [_tab_to_summary(t) for t in (doc.tabs or [])]
 
     def get_nested_tabs(self, document_id: str, tab_id: str) -> list[TabSummary]:
@@ -188,7 +297,7 @@ class Downloader:
         Raises:
             ValueError: If no tab with the given *tab_id* exists.
         """
-        doc = self._client.get_document(document_id)
+        doc = self._client.get_document(document_id, fields=DOCUMENT_SUMMARY_FIELDS)
         target = _find_tab(doc.tabs or [], tab_id)
         if target is None:
             raise ValueError(f"No tab with tabId={tab_id!r} in document")
@@ -266,7 +375,11 @@ def remove_empty_dirs(root: Path) -> None:
             dirpath.rmdir()
 
 
-_UNSAFE_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+# Maps characters that are unsafe in file/directory names to underscores:
+# the Windows-reserved punctuation plus every ASCII control character
+_UNSAFE_CHARS_TABLE = str.maketrans(dict.fromkeys([*'<>:"/\\|?*', *map(chr, range(0x20))], "_"))
+
+_UNDERSCORE_RUNS_RE = re.compile(r"__+")
 
 
 def sanitize_filename(name: str) -> str:
@@ -276,11 +389,62 @@ def sanitize_filename(name: str) -> str:
     with underscores, and collapses runs of underscores.
     """
     name = name.strip().strip(".")
-    name = _UNSAFE_CHARS.sub("_", name)
-    name = re.sub(r"_+", "_", name)
+    name = name.translate(_UNSAFE_CHARS_TABLE)
+    if "__" in name:
+        name = _UNDERSCORE_RUNS_RE.sub("_", name)
     return name or "Untitled"
 
 
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write *data* to *path* via a uniquely named sibling temp file and an atomic rename.
+
+    An interrupted download leaves the previous file intact instead of a
+    truncated one, and concurrent downloads never share a temp file. The
+    result keeps the permissions of the file it replaces; new files get the
+    usual umask-derived mode.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    tmp_path = Path(tmp_name)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            try:
+                shutil.copymode(path, tmp_path)
+            except FileNotFoundError:
+                os.chmod(tmp_path, 0o666 & ~_current_umask())
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# Process umask at import time, the fallback where /proc is unavailable.
+# os.umask can only be read by setting it, which races with other threads,
+# so it is done once here, before any download threads exist.
+_IMPORT_UMASK = os.umask(0o022)
+os.umask(_IMPORT_UMASK)
+
+
+def _current_umask() -> int:
+    """Return the process umask without changing it.
+
+    Read from ``/proc/self/status`` where available (Linux), otherwise the
+    value captured at import time.
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    return _IMPORT_UMASK
+
+
 def _tab_to_summary(tab: Tab) -> TabSummary:
     """Convert a Pydantic ``Tab`` model to a lightweight ``TabSummary``."""
     props = tab.tabProperties
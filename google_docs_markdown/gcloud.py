@@ -5,10 +5,40 @@ Provides a unified interface for running gcloud commands with consistent
 error handling and messaging.
 """
 
+import configparser
+import os
+import random
 import subprocess
+import sys
+import time
+from pathlib import Path
 
 import typer
 
+# How long cached gcloud_run output stays valid, in seconds
+RUN_CACHE_TTL = 60.0
+
+# Output of successful cached gcloud_run calls: command -> (stored at, stdout)
+_run_cache: dict[tuple[str, ...], tuple[float, str | None]] = {}
+
+# Base delay in seconds for jittered exponential backoff between gcloud_run retries
+RUN_RETRY_BASE_DELAY = 0.5
+
+# Markers in gcloud's stderr that identify a transient control-plane or network failure
+_TRANSIENT_ERROR_MARKERS = (
+    "UNAVAILABLE",
+    "DEADLINE_EXCEEDED",
+    "RESOURCE_EXHAUSTED",
+    "HTTPError 429",
+    "HTTPError 500",
+    "HTTPError 502",
+    "HTTPError 503",
+    "HTTPError 504",
+    "Connection reset",
+    "Connection aborted",
+    "Temporary failure in name resolution",
+)
+
 
 class GCloudException(Exception):
     """Exception raised when a gcloud command fails."""
@@ -36,11 +66,69 @@ class GCloudException(Exception):
         super().__init__(full_message)
 
 
+def _gcloud_config_dir() -> Path:
+    """Return the gcloud user configuration directory."""
+    override = os.environ.get("CLOUDSDK_CONFIG")
+    if override:
+        return Path(override)
+    if sys.platform == "win32" and os.environ.get("APPDATA"):
+        return Path(os.environ["APPDATA"]) / "gcloud"
+    return Path.home() / ".config" / "gcloud"
+
+
+def application_default_credentials_path() -> Path:
+    """Return where ``gcloud auth application-default login`` stores credentials.
+
+    The file may not exist.
+    """
+    return _gcloud_config_dir() / "application_default_credentials.json"
+
+
+def _read_config_property(prop: str) -> str | None:
+    """Resolve a gcloud property without spawning gcloud.
+
+    Honors the ``CLOUDSDK_<SECTION>_<NAME>`` environment override, then reads
+    the active named configuration file. Returns None whenever the value
+    cannot be resolved this way (unset, unreadable, or only defined in
+    installation-wide properties), so callers can fall back to gcloud itself.
+
+    Args:
+        prop: Property name, either bare (``project``, meaning ``core/project``)
+              or ``section/name`` (e.g. ``compute/region``).
+    """
+    section, _, name = prop.rpartition("/")
+    section = section or "core"
+
+    env_value = os.environ.get(f"CLOUDSDK_{section}_{name}".upper())
+    if env_value:
+        return env_value
+
+    config_dir = _gcloud_config_dir()
+    active = os.environ.get("CLOUDSDK_ACTIVE_CONFIG_NAME")
+    if not active:
+        try:
+            active = (config_dir / "active_config").read_text(encoding="utf-8").strip()
+        except OSError:
+            active = ""
+
+    parser = configparser.ConfigParser(interpolation=None)
+    try:
+        if not parser.read(config_dir / "configurations" / f"config_{active or 'default'}", encoding="utf-8"):
+            return None
+    except configparser.Error:
+        return None
+
+    value = parser.get(section, name, fallback="").strip()
+    return value or None
+
+
 def gcloud_run(
     command: list[str],
     operation: str,
     timeout: int | None = None,
     raise_exception: bool = True,
+    cache: bool = False,
+    retries: int = 0,
 ) -> str | None:
     """Run a gcloud command and return stdout text or None on error.
 
@@ -51,6 +139,12 @@ def gcloud_run(
         timeout: Optional timeout in seconds. Defaults to None (no timeout).
         raise_exception: If True (default), raise GCloudException on error.
                          If False, return None and print error message.
+        cache: If True, serve a successful result of the same command from the last
+               ``RUN_CACHE_TTL`` seconds instead of spawning gcloud again. Only use
+               for read-only commands; any gcloud_exec call clears the cache.
+        retries: How many times to re-run the command after a transient failure
+                 (network errors, 429/5xx from the API), with jittered exponential
+                 backoff. Only use for read-only commands.
 
     Returns:
         The stdout text from the command, stripped of leading/trailing whitespace,
@@ -77,17 +171,40 @@ def gcloud_run(
         >>> if project:
         ...     print(f"Current project: {project}")
     """
+    # ``config get-value`` is answered from the config files when possible;
+    # gcloud is only spawned if that cannot resolve the property
+    if len(command) == 3 and command[:2] == ["config", "get-value"]:
+        value = _read_config_property(command[2])
+        if value is not None:
+            return value
+
+    key = tuple(command)
+    if cache:
+        cached = _run_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < RUN_CACHE_TTL:
+            return cached[1]
+
     full_command = ["gcloud"] + command
 
     try:
-        result = subprocess.run(
-            full_command,
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=timeout,
-        )
-        return result.stdout.strip() if result.stdout else None
+        for attempt in range(retries + 1):
+            try:
+                result = subprocess.run(
+                    full_command,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    timeout=timeout,
+                )
+                break
+            except subprocess.CalledProcessError as e:
+                if attempt == retries or not _is_transient(e):
+                    raise
+                time.sleep(random.uniform(0, RUN_RETRY_BASE_DELAY * 2**attempt))
+        output = result.stdout.strip() if result.stdout else None
+        if cache:
+            _run_cache[key] = (time.monotonic(), output)
+        return output
     except FileNotFoundError as e:
         error_message = (
             f"❌ Error: gcloud CLI not found. Cannot {operation}.\n"
@@ -128,11 +245,18 @@ def gcloud_run(
         return None
 
 
+def _is_transient(error: subprocess.CalledProcessError) -> bool:
+    """Return True if gcloud's stderr points at a failure worth retrying."""
+    stderr = error.stderr or ""
+    return any(marker in stderr for marker in _TRANSIENT_ERROR_MARKERS)
+
+
 def gcloud_exec(
     command: list[str],
     operation: str,
     timeout: int | None = None,
     raise_exception: bool = True,
+    quiet: bool = False,
 ) -> bool:
     """Execute a gcloud command that doesn't return output.
 
@@ -143,6 +267,9 @@ def gcloud_exec(
         timeout: Optional timeout in seconds. Defaults to None (no timeout).
         raise_exception: If True (default), raise GCloudException on error.
                          If False, return False and print error message.
+        quiet: If True, discard the command's stdout and capture its stderr for the
+               error message instead of streaming both to the terminal. Leave False
+               for interactive commands (login, revoke) whose prompts must be seen.
 
     Returns:
         True if the command succeeded, False if the command failed and raise_exception=False.
@@ -169,13 +296,25 @@ def gcloud_exec(
         ...     print("Failed to set project")
     """
     full_command = ["gcloud"] + command
+    # Any exec may change configuration that cached reads depend on
+    _run_cache.clear()
 
     try:
-        subprocess.run(
-            full_command,
-            check=True,
-            timeout=timeout,
-        )
+        if quiet:
+            subprocess.run(
+                full_command,
+                check=True,
+                timeout=timeout,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        else:
+            subprocess.run(
+                full_command,
+                check=True,
+                timeout=timeout,
+            )
         return True
     except FileNotFoundError as e:
         error_message = (
@@ -195,6 +334,8 @@ def gcloud_exec(
         return False
     except subprocess.CalledProcessError as e:
         error_message = f"❌ Error {operation}: {e}\nCommand: {' '.join(full_command)}"
+        if e.stderr:
+            error_message += f"\n{e.stderr.strip()}"
         if raise_exception:
             raise GCloudException(
                 message=error_message,
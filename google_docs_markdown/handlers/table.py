@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from google_docs_markdown.handlers.base import BlockElementHandler
@@ -14,6 +15,12 @@ def _escape_pipe(text: str) -> str:
     return text.replace("|", "\\|")
 
 
+@lru_cache(maxsize=32)
+def _separator_row(col_count: int) -> str:
+    """Return the header separator row for a table with *col_count* columns."""
+    return "| " + " | ".join(["---"] * col_count) + " |"
+
+
 class TableHandler(BlockElementHandler):
     def serialize_match(self, element: Any) -> bool:
         return hasattr(element, "table") and element.table is not None
@@ -39,10 +46,10 @@ class TableHandler(BlockElementHandler):
 
         col_count = table.columns or (max(len(r) for r in rows) if rows else 0)
         for r in rows:
-            while len(r) < col_count:
-                r.append("")
+            if len(r) < col_count:
+                r.extend([""] * (col_count - len(r)))
 
-        separator = "| " + " | ".join("---" for _ in range(col_count)) + " |"
+        separator = _separator_row(col_count)
 
         lines: list[str] = []
         for i, r in enumerate(rows):
@@ -93,6 +93,10 @@ class TextRunHandler(ElementHandler):
         has_chip = _CHIP_PLACEHOLDER in content
 
         style = text_run.textStyle
+        if style is not None and not style.model_fields_set:
+            # Plain runs arrive as ``textStyle: {}``; treating that as no style
+            # lets every formatting and style-extraction check short-circuit.
+            style = None
         bold = style and style.bold
         italic = style and style.italic
         strikethrough = style and style.strikethrough
@@ -68,6 +68,10 @@ _BulletPreset = Literal[
     "NUMBERED_DECIMAL_ALPHA_ROMAN",
 ]
 
+# Requests that only restyle existing text. They never shift indices, so they
+# can be deferred until after a later contiguous insertText has been merged.
+_STYLE_REQUEST_FIELDS = ("updateTextStyle", "updateParagraphStyle", "createParagraphBullets")
+
 _TITLE_TAG_RE = re.compile(r"<!--\s*title\s*-->\s*\n?")
 _SUBTITLE_TAG_RE = re.compile(r"<!--\s*subtitle\s*-->\s*\n?")
 
@@ -109,7 +113,7 @@ class MarkdownDeserializer:
         )
 
         self._process_content(content, ctx)
-        return [r for r in ctx.requests if isinstance(r, Request)]
+        return _coalesce_inserts([r for r in ctx.requests if isinstance(r, Request)])
 
     def _process_content(self, content: str, ctx: DeserContext) -> None:
         """Process Markdown content via markdown-it AST and comment-tag dispatch.
@@ -546,37 +550,23 @@ class MarkdownDeserializer:
         Skips HTML segments (already handled as tags).  Consecutive characters
         sharing the same formatting are batched into a single insert + style request.
         """
-        # Collect (char, formatting) pairs for the range, skipping HTML segments
-        chars_with_fmt: list[tuple[str, list[str]]] = []
-        for i in range(start, end):
-            ch = raw[i]
-            fmt: list[str] = []
-            kind = "text"
-            for seg_start, seg_end, seg_kind, seg_fmt in seg_ranges:
-                if seg_start <= i < seg_end:
-                    kind = seg_kind
-                    fmt = seg_fmt
-                    break
-            if kind == "html":
+        # Clip each segment to the range and group into runs of identical
+        # formatting, skipping HTML segments.  Working per segment rather than
+        # per character keeps this linear in the number of segments.
+        runs: list[tuple[str, list[str]]] = []
+        for seg_start, seg_end, seg_kind, seg_fmt in seg_ranges:
+            lo = max(seg_start, start)
+            hi = min(seg_end, end)
+            if lo >= hi or seg_kind == "html":
                 continue
-            chars_with_fmt.append((ch, fmt))
+            if runs and runs[-1][1] == seg_fmt:
+                runs[-1] = (runs[-1][0] + raw[lo:hi], seg_fmt)
+            else:
+                runs.append((raw[lo:hi], seg_fmt))
 
-        if not chars_with_fmt:
+        if not runs:
             return
 
-        # Group into runs of identical formatting
-        runs: list[tuple[str, list[str]]] = []
-        current_text = chars_with_fmt[0][0]
-        current_fmt = chars_with_fmt[0][1]
-        for ch, fmt in chars_with_fmt[1:]:
-            if fmt == current_fmt:
-                current_text += ch
-            else:
-                runs.append((current_text, current_fmt))
-                current_text = ch
-                current_fmt = fmt
-        runs.append((current_text, current_fmt))
-
         # Emit each run.  When a run has less formatting than its predecessor,
         # explicitly clear the dropped fields so Google Docs doesn't inherit
         # the adjacent style (e.g. bold leaking onto unformatted text).
@@ -885,3 +875,65 @@ def deserialize(
         tab_id=tab_id,
         segment_id=segment_id,
     )
+
+
+def _coalesce_inserts(requests: list[Request]) -> list[Request]:
+    """Merge runs of back-to-back ``insertText`` requests into one insert.
+
+    The walker emits one insert per paragraph (and per formatting run), each
+    appending at the index where the previous one ended. Such a run is fused
+    into a single ``insertText``; the style requests emitted in between are
+    moved after it unchanged, since their ranges lie entirely before the
+    append point and so already refer to the final indices.
+
+    Any other request (tables, images, page breaks, ...) ends the run and
+    keeps its original position.
+    """
+    result: list[Request] = []
+    pending: InsertTextRequest | None = None
+    pending_end = 0
+    deferred: list[Request] = []
+
+    def flush() -> None:
+        nonlocal pending
+        if pending is not None:
+            result.append(Request(insertText=pending))
+            result.extend(deferred)
+            deferred.clear()
+            pending = None
+
+    for req in requests:
+        insert = req.insertText
+        location = insert.location if insert is not None else None
+        if insert is not None and location is not None and location.index is not None:
+            text = insert.text or ""
+            if (
+                pending is not None
+                and pending.location is not None
+                and location.index == pending_end
+                and location.segmentId == pending.location.segmentId
+                and location.tabId == pending.location.tabId
+            ):
+                pending = InsertTextRequest(text=(pending.text or "") + text, location=pending.location)
+            else:
+                flush()
+                pending = InsertTextRequest(text=text, location=location)
+            pending_end = location.index + len(text)
+        elif pending is not None and _is_deferrable_style(req, pending_end):
+            deferred.append(req)
+        else:
+            flush()
+            result.append(req)
+
+    flush()
+    return result
+
+
+def _is_deferrable_style(req: Request, append_index: int) -> bool:
+    """Return whether *req* only restyles text that ends at or before *append_index*."""
+    for field in _STYLE_REQUEST_FIELDS:
+        sub = getattr(req, field)
+        if sub is not None:
+            rng = sub.range
+            return rng is not None and rng.endIndex is not None and rng.endIndex <= append_index
+    return False
@@ -15,7 +15,7 @@ Handles:
 from __future__ import annotations
 
 import re
-from typing import Any
+from typing import Any, cast
 
 from google_docs_markdown.block_grouper import (
     Block,
@@ -33,11 +33,38 @@ from google_docs_markdown.metadata import serialize_metadata
 from google_docs_markdown.models.common import Footnote
 from google_docs_markdown.models.document import DocumentTab
 from google_docs_markdown.models.elements import (
+    Paragraph,
     ParagraphElement,
     StructuralElement,
 )
 from google_docs_markdown.source_map import SourceMap, SourceMapBuilder, SpanKind
 
+# Partial-response mask for the ``DocumentTab`` parts the serializer reads.
+# documentStyle, namedRanges, positionedObjects and the suggestion maps are
+# never rendered, so fetches feeding the serializer can leave them out.
+DOCUMENT_TAB_FIELDS = "documentTab(body,footers,footnotes,headers,inlineObjects,lists,namedStyles)"
+
+# Partial-response masks for whole documents. Google Docs nests tabs at most
+# three levels deep; the masks reach one level further.
+_TAB_PROPERTIES_FIELDS = "tabProperties(tabId,title,nestingLevel,parentTabId)"
+
+
+def _tabs_mask(tab_fields: str) -> str:
+    """Return a ``tabs(...)`` mask selecting *tab_fields* on every nesting level."""
+    return f"tabs({tab_fields},childTabs({tab_fields},childTabs({tab_fields},childTabs({tab_fields}))))"
+
+
+# Title and tab tree only. Listing tabs and then asking for the title share
+# this mask, so the second call is served by the transport's document cache.
+DOCUMENT_SUMMARY_FIELDS = f"documentId,title,{_tabs_mask(_TAB_PROPERTIES_FIELDS)}"
+
+# Everything the serializer renders, without the style and suggestion maps
+# it never reads.
+DOCUMENT_CONTENT_FIELDS = f"documentId,title,{_tabs_mask(f'{_TAB_PROPERTIES_FIELDS},{DOCUMENT_TAB_FIELDS}')}"
+
+# Three or more consecutive newlines, collapsed to one blank line on output
+_EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
+
 
 class MarkdownSerializer:
     """Serialize a DocumentTab Pydantic model into Markdown text.
@@ -229,8 +256,8 @@ class MarkdownSerializer:
     # ------------------------------------------------------------------
 
     def _visit_paragraph(self, element: StructuralElement, ctx: SerContext) -> str:
-        paragraph = element.paragraph
-        assert paragraph is not None
+        # Only called when element.paragraph is set
+        paragraph = cast(Paragraph, element.paragraph)
         style_type = None
         if paragraph.paragraphStyle:
             style_type = paragraph.paragraphStyle.namedStyleType
@@ -382,14 +409,14 @@ def _merge_style_segments(
             i += 1
             continue
 
-        group_content = content
+        group_parts = [content]
         group_props = props
         i += 1
 
         while i < len(segments):
             next_content, next_props = segments[i]
             if next_props == group_props:
-                group_content += next_content
+                group_parts.append(next_content)
                 i += 1
             elif (
                 next_props is None
@@ -397,12 +424,12 @@ def _merge_style_segments(
                 and i + 1 < len(segments)
                 and segments[i + 1][1] == group_props
             ):
-                group_content += next_content
+                group_parts.append(next_content)
                 i += 1
             else:
                 break
 
-        result.append((group_content, group_props))
+        result.append(("".join(group_parts), group_props))
 
     return result
 
@@ -474,6 +501,5 @@ def _join_paragraphs(paragraphs: list[str]) -> str:
     """
     if not paragraphs:
         return ""
-    result = "\n\n".join(paragraphs)
-    result = re.sub(r"\n{3,}", "\n\n", result)
+    result = _EXCESS_NEWLINES_RE.sub("\n\n", "\n\n".join(paragraphs))
     return result.rstrip("\n") + "\n"
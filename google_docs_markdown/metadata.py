@@ -76,6 +76,8 @@ def parse_metadata(markdown_text: str) -> dict[str, Any] | None:
     Returns ``None`` if no metadata block is found.  The ``\\u003e``
     escapes are transparently decoded by the JSON parser.
     """
+    if _METADATA_START not in markdown_text:
+        return None
     m = _METADATA_RE.search(markdown_text)
     if not m:
         return None
@@ -88,4 +90,6 @@ def strip_metadata(markdown_text: str) -> str:
 
     Useful for diffing content without metadata.
     """
-    return _METADATA_RE.sub("", markdown_text).rstrip("\n") + "\n"
+    if _METADATA_START in markdown_text:
+        markdown_text = _METADATA_RE.sub("", markdown_text)
+    return markdown_text.rstrip("\n") + "\n"
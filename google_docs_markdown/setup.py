@@ -4,14 +4,24 @@ Setup module for Google Docs Markdown tool.
 Handles authentication, project configuration, and API enablement.
 """
 
+import os
+import shutil
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 
 import typer
 from google.auth import default
-from google.auth.exceptions import DefaultCredentialsError
+from google.auth.credentials import Credentials
+from google.auth.exceptions import DefaultCredentialsError, GoogleAuthError
 
-from google_docs_markdown.gcloud import GCloudException, gcloud_exec, gcloud_run
+from google_docs_markdown.gcloud import (
+    GCloudException,
+    application_default_credentials_path,
+    gcloud_exec,
+    gcloud_run,
+)
 
 # Required scopes for the application
 REQUIRED_SCOPES = [
@@ -25,17 +35,67 @@ REQUIRED_SCOPES = [
 # Google Docs API service name
 DOCS_API_SERVICE = "docs.googleapis.com"
 
+# Retries for read-only control-plane queries that fail transiently
+READ_RETRIES = 2
+
+# How long resolved Application Default Credentials are reused, in seconds
+ADC_CACHE_TTL = 60.0
+
+# Resolved Application Default Credentials: scopes -> (resolved at, (credentials, project))
+_adc_cache: dict[tuple[str, ...], tuple[float, tuple[Credentials, str | None]]] = {}
+
+# Projects where Google Docs API is known to be enabled during this process
+_docs_api_enabled_projects: set[str] = set()
+
+
+def _default_credentials(scopes: list[str]) -> tuple[Credentials, str | None]:
+    """Return ``google.auth.default(scopes=...)``, reusing a result from the last ``ADC_CACHE_TTL`` seconds.
+
+    Only successful lookups are cached; errors propagate and are retried on the next call.
+    """
+    key = tuple(scopes)
+    cached = _adc_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < ADC_CACHE_TTL:
+        return cached[1]
+    result = default(scopes=scopes)
+    _adc_cache[key] = (time.monotonic(), result)
+    return result
+
+
+def clear_setup_caches() -> None:
+    """Forget cached credentials and API state, e.g. after revoking credentials or logging in again."""
+    _adc_cache.clear()
+    _docs_api_enabled_projects.clear()
+
 
 def check_gcloud_installed() -> bool:
-    """Check if gcloud CLI is installed."""
-    result = gcloud_run(["--version"], operation="checking gcloud installation", timeout=10)
-    return result is not None
+    """Check if gcloud CLI is installed.
+
+    A PATH lookup rather than running ``gcloud --version``, which would start
+    gcloud's own Python interpreter just to prove the launcher exists.
+    """
+    return shutil.which("gcloud") is not None
+
+
+def _adc_file_configured() -> bool:
+    """Return True if an Application Default Credentials file is set up, without loading it.
+
+    When no file is found, ``google.auth.default()`` goes on to probe the GCE
+    metadata server, which off-GCE can take seconds to time out. Setup only
+    counts file-based credentials (what ``gcloud auth application-default
+    login`` writes), so that probe is never needed to answer the question.
+    """
+    if os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"):
+        return True
+    return application_default_credentials_path().is_file()
 
 
 def check_credentials_exist() -> bool:
     """Check if Application Default Credentials are already configured."""
+    if not _adc_file_configured():
+        return False
     try:
-        credentials, _ = default(scopes=REQUIRED_SCOPES)
+        credentials, _ = _default_credentials(REQUIRED_SCOPES)
         # If we can get credentials with the required scopes, they're configured
         return credentials is not None
     except DefaultCredentialsError:
@@ -55,6 +115,7 @@ def get_current_project() -> str | None:
         ["config", "get-value", "project"],
         operation="getting current default GCP project",
         timeout=10,
+        cache=True,
     )
     return current_project if current_project else None
 
@@ -65,11 +126,11 @@ def list_available_projects() -> list[str]:
         ["projects", "list", "--format=value(projectId)"],
         operation="listing available GCP projects",
         timeout=30,
+        retries=READ_RETRIES,
     )
     if output is None:
         return []
-    projects = [p.strip() for p in output.split("\n") if p.strip()]
-    return projects
+    return [p for p in map(str.strip, output.splitlines()) if p]
 
 
 def set_project(project_id: str) -> bool:
@@ -78,11 +139,59 @@ def set_project(project_id: str) -> bool:
         ["config", "set", "project", project_id],
         operation=f"setting default GCP project to '{project_id}'",
         timeout=10,
+        quiet=True,
     )
 
 
+def _query_docs_api_enabled(project_id: str) -> bool | None:
+    """Ask the Service Usage API whether Google Docs API is enabled for the project.
+
+    One ``services.get`` round-trip with the Application Default Credentials,
+    instead of a gcloud subprocess listing every enabled service. Projects
+    already seen enabled in this process are answered without a request.
+
+    Returns:
+        True or False with the API's answer, or None if it could not be asked
+        (no credentials, no permission, network error) and the caller should
+        fall back to gcloud.
+    """
+    if project_id in _docs_api_enabled_projects:
+        return True
+    try:
+        import google_auth_httplib2
+        import httplib2
+        from google.auth.credentials import CredentialsWithQuotaProject
+        from googleapiclient.discovery import build
+        from googleapiclient.errors import HttpError
+        from googleapiclient.http import build_http
+    except ImportError:
+        return None
+    try:
+        credentials, _ = _default_credentials(REQUIRED_SCOPES)
+        # User credentials need a quota project for Service Usage calls
+        if isinstance(credentials, CredentialsWithQuotaProject) and not credentials.quota_project_id:
+            credentials = credentials.with_quota_project(project_id)
+        http = google_auth_httplib2.AuthorizedHttp(credentials, http=build_http())
+        service = build("serviceusage", "v1", http=http, cache_discovery=False, static_discovery=True)
+        response = (
+            service.services()
+            .get(name=f"projects/{project_id}/services/{DOCS_API_SERVICE}")
+            .execute(num_retries=READ_RETRIES)
+        )
+    # GoogleAuthError covers DefaultCredentialsError and refresh failures
+    except (GoogleAuthError, HttpError, httplib2.HttpLib2Error, OSError):
+        return None
+    if response.get("state") != "ENABLED":
+        return False
+    _docs_api_enabled_projects.add(project_id)
+    return True
+
+
 def check_api_enabled(project_id: str) -> bool:
     """Check if Google Docs API is enabled for the project."""
+    enabled = _query_docs_api_enabled(project_id)
+    if enabled is not None:
+        return enabled
     output = gcloud_run(
         [
             "services",
@@ -94,16 +203,18 @@ def check_api_enabled(project_id: str) -> bool:
         ],
         operation=f"checking if Google Docs API is enabled for project '{project_id}'",
         timeout=30,
+        retries=READ_RETRIES,
     )
-    if output is None:
+    # The name filter leaves at most the Docs API's own line in the output
+    if not output or DOCS_API_SERVICE not in output:
         return False
-    enabled_services = output.split("\n")
-    return any(DOCS_API_SERVICE in service for service in enabled_services if service)
+    _docs_api_enabled_projects.add(project_id)
+    return True
 
 
 def enable_docs_api(project_id: str) -> bool:
     """Enable Google Docs API for the project."""
-    return gcloud_exec(
+    enabled = gcloud_exec(
         [
             "services",
             "enable",
@@ -112,11 +223,16 @@ def enable_docs_api(project_id: str) -> bool:
         ],
         operation=f"enabling Google Docs API for project '{project_id}'",
         timeout=60,
+        quiet=True,
     )
+    if enabled:
+        _docs_api_enabled_projects.add(project_id)
+    return enabled
 
 
 def revoke_credentials() -> bool:
     """Revoke existing Application Default Credentials."""
+    clear_setup_caches()
     return gcloud_exec(
         ["auth", "application-default", "revoke"],
         operation="revoking Application Default Credentials",
@@ -124,6 +240,14 @@ def revoke_credentials() -> bool:
     )
 
 
+@lru_cache(maxsize=8)
+def _compose_scopes(extra_scopes: str) -> str:
+    """Return REQUIRED_SCOPES plus the comma-separated *extra_scopes*, joined with commas."""
+    # Split by comma, strip whitespace, and add non-empty scopes
+    additional = [s.strip() for s in extra_scopes.split(",") if s.strip()]
+    return ",".join([*REQUIRED_SCOPES, *additional])
+
+
 def run_auth_login(extra_scopes: str = "", client_id_file: str | None = None) -> bool:
     """Run gcloud auth application-default login with required scopes.
 
@@ -131,13 +255,7 @@ def run_auth_login(extra_scopes: str = "", client_id_file: str | None = None) ->
         extra_scopes: Additional comma-separated scopes to append to REQUIRED_SCOPES.
         client_id_file: Path to client ID file for OAuth authentication.
     """
-    scopes = REQUIRED_SCOPES.copy()
-    if extra_scopes:
-        # Split by comma, strip whitespace, and add non-empty scopes
-        additional = [s.strip() for s in extra_scopes.split(",") if s.strip()]
-        scopes.extend(additional)
-
-    scopes_str = ",".join(scopes)
+    scopes_str = _compose_scopes(extra_scopes)
 
     cmd = [
         "auth",
@@ -149,6 +267,7 @@ def run_auth_login(extra_scopes: str = "", client_id_file: str | None = None) ->
     if client_id_file:
         cmd.append(f"--client-id-file={client_id_file}")
 
+    clear_setup_caches()
     return gcloud_exec(
         cmd,
         operation="running authentication",
@@ -201,6 +320,7 @@ def setup(revoke: bool = False, extra_scopes: str = "", client_id_file: str | No
     # Revoke existing credentials if requested
     if revoke:
         typer.echo("Revoking existing Application Default Credentials...")
+        clear_setup_caches()
         try:
             gcloud_exec(
                 ["auth", "application-default", "revoke"],
@@ -223,35 +343,15 @@ def setup(revoke: bool = False, extra_scopes: str = "", client_id_file: str | No
         if client_id_file:
             typer.echo(f"Using client ID file: {client_id_file}")
         typer.echo("This will open a browser window for authentication...")
+        scopes_str = _compose_scopes(extra_scopes)
         try:
-            scopes = REQUIRED_SCOPES.copy()
-            if extra_scopes:
-                additional = [s.strip() for s in extra_scopes.split(",") if s.strip()]
-                scopes.extend(additional)
-            scopes_str = ",".join(scopes)
-            cmd = [
-                "auth",
-                "application-default",
-                "login",
-                f"--scopes={scopes_str}",
-            ]
-            if client_id_file:
-                cmd.append(f"--client-id-file={client_id_file}")
-            gcloud_exec(
-                cmd,
-                operation="running authentication",
-                timeout=300,  # 5 minutes timeout for interactive login
-            )
+            run_auth_login(extra_scopes, client_id_file)
             typer.echo("✅ Application Default Credentials configured\n")
         except GCloudException as e:
-            scopes = REQUIRED_SCOPES.copy()
-            if extra_scopes:
-                additional = [s.strip() for s in extra_scopes.split(",") if s.strip()]
-                scopes.extend(additional)
             typer.echo(
                 f"❌ Failed to set up Application Default Credentials: {e.message}\n"
                 "Please run manually:\n"
-                f'  gcloud auth application-default login --scopes="{",".join(scopes)}"',
+                f'  gcloud auth application-default login --scopes="{scopes_str}"',
                 err=True,
             )
             sys.exit(1)
@@ -264,15 +364,7 @@ def setup(revoke: bool = False, extra_scopes: str = "", client_id_file: str | No
     else:
         typer.echo("No default project is set.")
         try:
-            output = gcloud_run(
-                ["projects", "list", "--format=value(projectId)"],
-                operation="listing available GCP projects",
-                timeout=30,
-            )
-            if output is None:
-                projects = []
-            else:
-                projects = [p.strip() for p in output.split("\n") if p.strip()]
+            projects = list_available_projects()
         except GCloudException as e:
             typer.echo(
                 f"❌ Failed to list projects: {e.message}\n"
@@ -294,21 +386,16 @@ def setup(revoke: bool = False, extra_scopes: str = "", client_id_file: str | No
         for i, project in enumerate(projects, 1):
             typer.echo(f"  {i}. {project}")
 
+        # Accept either the listed number or the project ID itself
+        choices = {str(i): project for i, project in enumerate(projects, 1)}
+        choices.update((project, project) for project in projects)
         while True:
             try:
                 choice = typer.prompt(f"\nSelect a project (1-{len(projects)}) or enter project ID").strip()
-                # Try to parse as number first
-                if choice.isdigit():
-                    idx = int(choice) - 1
-                    if 0 <= idx < len(projects):
-                        selected_project = projects[idx]
-                        break
-                # Otherwise treat as project ID
-                elif choice in projects:
-                    selected_project = choice
+                if choice in choices:
+                    selected_project = choices[choice]
                     break
-                else:
-                    typer.echo(f"Invalid choice: {choice}. Please try again.", err=True)
+                typer.echo(f"Invalid choice: {choice}. Please try again.", err=True)
             except KeyboardInterrupt:
                 typer.echo("\n\nSetup cancelled.", err=True)
                 sys.exit(1)
@@ -318,6 +405,7 @@ def setup(revoke: bool = False, extra_scopes: str = "", client_id_file: str | No
                 ["config", "set", "project", selected_project],
                 operation=f"setting default GCP project to '{selected_project}'",
                 timeout=10,
+                quiet=True,
             )
             typer.echo(f"✅ Default project set to: {selected_project}\n")
             current_project = selected_project
@@ -337,22 +425,7 @@ def setup(revoke: bool = False, extra_scopes: str = "", client_id_file: str | No
 
     typer.echo(f"Checking if Google Docs API is enabled for project '{current_project}'...")
     try:
-        output = gcloud_run(
-            [
-                "services",
-                "list",
-                "--enabled",
-                f"--project={current_project}",
-                f"--filter=name:{DOCS_API_SERVICE}",
-                "--format=value(name)",
-            ],
-            operation=f"checking if Google Docs API is enabled for project '{current_project}'",
-            timeout=30,
-        )
-        api_enabled = False
-        if output:
-            enabled_services = output.split("\n")
-            api_enabled = any(DOCS_API_SERVICE in service for service in enabled_services if service)
+        api_enabled = check_api_enabled(current_project)
     except GCloudException as e:
         typer.echo(
             f"⚠️  Warning: Failed to check if API is enabled: {e.message}\n"
@@ -367,16 +440,7 @@ def setup(revoke: bool = False, extra_scopes: str = "", client_id_file: str | No
     else:
         typer.echo(f"Enabling Google Docs API for project '{current_project}'...")
         try:
-            gcloud_exec(
-                [
-                    "services",
-                    "enable",
-                    DOCS_API_SERVICE,
-                    f"--project={current_project}",
-                ],
-                operation=f"enabling Google Docs API for project '{current_project}'",
-                timeout=60,
-            )
+            enable_docs_api(current_project)
             typer.echo("✅ Google Docs API enabled\n")
         except GCloudException as e:
             typer.echo(
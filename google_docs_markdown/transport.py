@@ -7,13 +7,27 @@ to the Google Docs API. Returns raw dicts as received from the API.
 
 from __future__ import annotations
 
+import copy
+import json
+import random
 import re
+import string
+import threading
+import time
 import typing
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
 
 from google.auth.credentials import Credentials
 from google.auth.exceptions import DefaultCredentialsError
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
 
 # Google API python clients are very weirdly typed so we need to use stubs to get the correct types
 # since these aren't "real" types, we need to use TYPE_CHECKING to get the correct types
@@ -21,6 +35,7 @@ from googleapiclient.discovery import build
 # and make sure you always have `from __future__ import annotations` at the top of the file!
 if typing.TYPE_CHECKING:
     from googleapiclient._apis.docs.v1 import DocsResource, Document, Request, Response
+    from googleapiclient.http import HttpRequest
 
 
 # Google Docs API scope
@@ -28,6 +43,90 @@ SCOPES = ["https://www.googleapis.com/auth/documents"]
 
 # Retry configuration
 MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0
+
+# Maximum number of sub-requests sent in a single batch HTTP request
+MAX_BATCH_SIZE = 100
+
+# Maximum number of requests sent in a single documents.batchUpdate call
+MAX_REQUESTS_PER_UPDATE = 500
+
+# Default worker count for parallel document fetches
+DEFAULT_MAX_WORKERS = 8
+
+# How long (seconds) a fetched document is reused before hitting the API again
+DOCUMENT_CACHE_TTL = 60.0
+
+# Most responses a transport keeps cached; the least recently used is dropped first
+DOCUMENT_CACHE_SIZE = 32
+
+# Application Default Credentials resolved by the first transport that needed them,
+# shared by later transports in the same process
+_cached_credentials: Credentials | None = None
+
+# Path segment preceding the ID in standard Google Docs URLs
+_DOC_PATH_PREFIX = "/document/d/"
+
+# Characters a document ID may contain
+_DOC_ID_CHARS = frozenset(string.ascii_letters + string.digits + "-_")
+
+# Pull a document ID out of a Google Docs URL, tried in this order: the
+# ``/document/d/ID`` path wins over an ``id=ID`` query parameter
+_DOC_ID_PATTERNS = (
+    re.compile(r"/document/d/([a-zA-Z0-9-_]+)"),
+    re.compile(r"id=([a-zA-Z0-9-_]+)"),
+)
+
+# A bare document ID: alphanumeric/dash/underscore, at least 10 characters
+_BARE_ID_RE = re.compile(r"^[a-zA-Z0-9-_]{10,}$")
+
+
+@lru_cache(maxsize=256)
+def _extract_document_id(url_or_id: str) -> str:
+    """Memoized implementation of GoogleDocsTransport.extract_document_id."""
+    # Standard ``/document/d/ID`` URLs are handled with a plain scan; the
+    # regexes are only needed for ``id=`` links and anything unusual. Like the
+    # patterns, the scan lets ``/document/d/`` win over any ``id=`` parameter.
+    start = url_or_id.find(_DOC_PATH_PREFIX)
+    if start >= 0:
+        begin = end = start + len(_DOC_PATH_PREFIX)
+        while end < len(url_or_id) and url_or_id[end] in _DOC_ID_CHARS:
+            end += 1
+        if end > begin:
+            return url_or_id[begin:end]
+
+    # The substring check lets bare IDs (the common CLI input) skip the regex
+    if start >= 0 or "id=" in url_or_id:
+        for pattern in _DOC_ID_PATTERNS:
+            match = pattern.search(url_or_id)
+            if match:
+                return match.group(1)
+
+    # If it's already just an ID (no slashes, no dots, looks like a doc ID)
+    # Google Docs IDs are typically 44 characters, but can vary
+    # They contain only alphanumeric, dashes, and underscores
+    # For testing, we accept shorter IDs (10+ chars) that match the format
+    if "/" not in url_or_id and "." not in url_or_id:
+        # Validate it looks like a document ID (alphanumeric/dash/underscore)
+        # Minimum 10 chars to avoid accepting generic strings, but allow test IDs
+        if _BARE_ID_RE.match(url_or_id):
+            return url_or_id
+
+    raise ValueError(f"Could not extract document ID from: {url_or_id}. Expected a Google Docs URL or document ID.")
+
+
+class CompactJsonModel(JsonModel):
+    """JsonModel that encodes request bodies without insignificant whitespace.
+
+    Large ``batchUpdate`` payloads are dominated by small repeated objects, so
+    dropping the default ``", "`` / ``": "`` separators trims both encode time
+    and bytes on the wire.
+    """
+
+    # The stubs declare BaseModel.serialize as returning None; it returns the body string.
+    # The Docs API does not use a data wrapper, so the body is encoded as-is.
+    def serialize(self, body_value: Any) -> str:  # type: ignore[override]
+        return json.dumps(body_value, separators=(",", ":"))
 
 
 @dataclass
@@ -56,7 +155,11 @@ class GoogleDocsTransport:
                         Application Default Credentials.
         """
         self.credentials = credentials
+        self._http: AuthorizedHttp | None = None
+        self._thread_local = threading.local()
         self._service: DocsResource | None = None
+        self._documents: DocsResource.DocumentsResource | None = None
+        self._document_cache: OrderedDict[tuple[str, str | None], tuple[float, Document]] = OrderedDict()
 
     @property
     def service(self) -> DocsResource:
@@ -65,24 +168,60 @@ class GoogleDocsTransport:
             self._service = self._build_service()
         return self._service
 
+    @property
+    def documents(self) -> DocsResource.DocumentsResource:
+        """The service's ``documents()`` collection, built once and reused."""
+        if self._documents is None:
+            self._documents = self.service.documents()
+        return self._documents
+
     def _build_service(self) -> DocsResource:
-        """Build and return the Google Docs API service."""
+        """Build and return the Google Docs API service.
+
+        The service is bound to a single long-lived ``AuthorizedHttp`` kept on the
+        transport, so consecutive API calls reuse the same keep-alive connection
+        instead of paying a fresh TCP+TLS handshake each time. The discovery
+        document is loaded from the copy bundled with ``googleapiclient``
+        (``static_discovery=True``) so building the service never hits the network.
+
+        The service and its ``AuthorizedHttp`` belong to this transport alone:
+        httplib2 connections are not thread-safe, so they are never shared
+        between transports.
+        """
         if self.credentials is None:
             self.credentials = self._get_credentials()
 
-        return build("docs", "v1", credentials=self.credentials)
+        if self._http is None:
+            self._http = self._new_http()
+
+        return build(
+            "docs",
+            "v1",
+            http=self._http,
+            model=CompactJsonModel(),
+            cache_discovery=False,
+            static_discovery=True,
+        )
 
     def _get_credentials(self) -> Credentials:
         """
         Get credentials using Application Default Credentials (ADC).
 
+        ADC is resolved once per process; later transports reuse the same
+        credentials instead of re-reading the ADC file.
+
         Raises:
             DefaultCredentialsError: If credentials cannot be obtained.
         """
+        global _cached_credentials
+        if _cached_credentials is not None:
+            return _cached_credentials
+
         try:
             from google.auth import default
 
             credentials, _ = default(scopes=SCOPES)
+            _cached_credentials = credentials
             return credentials
         except DefaultCredentialsError as e:
             raise DefaultCredentialsError(
@@ -112,38 +251,24 @@ class GoogleDocsTransport:
         Raises:
             ValueError: If document ID cannot be extracted from the URL
         """
-        # Try to extract from URL patterns first
-        patterns = [
-            r"/document/d/([a-zA-Z0-9-_]+)",
-            r"id=([a-zA-Z0-9-_]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url_or_id)
-            if match:
-                return match.group(1)
+        return _extract_document_id(url_or_id)
 
-        # If it's already just an ID (no slashes, no dots, looks like a doc ID)
-        # Google Docs IDs are typically 44 characters, but can vary
-        # They contain only alphanumeric, dashes, and underscores
-        # For testing, we accept shorter IDs (10+ chars) that match the format
-        if "/" not in url_or_id and "." not in url_or_id:
-            # Validate it looks like a document ID (alphanumeric/dash/underscore)
-            # Minimum 10 chars to avoid accepting generic strings, but allow test IDs
-            if re.match(r"^[a-zA-Z0-9-_]{10,}$", url_or_id):
-                return url_or_id
-
-        raise ValueError(f"Could not extract document ID from: {url_or_id}. Expected a Google Docs URL or document ID.")
-
-    def get_document(self, document_id: str) -> Document:
+    def get_document(self, document_id: str, *, fields: str | None = None) -> Document:
         """
         Retrieve a document from Google Docs API.
 
         Always includes content from all tabs, treating every document as a multi-tab document
-        (even if it only has a single tab).
+        (even if it only has a single tab). Responses are cached per document for
+        DOCUMENT_CACHE_TTL seconds, so callers that need several views of the same
+        document (e.g. title and tabs) only pay for one API call. At most
+        DOCUMENT_CACHE_SIZE responses are kept. A freshly fetched response is
+        cached as-is and must not be mutated; cache hits return a deep copy. Any
+        batch update through this transport invalidates the cached copy.
 
         Args:
             document_id: The document ID
+            fields: Optional partial-response field mask (e.g. ``"title"``). Only
+                    the selected fields are transferred and parsed.
 
         Returns:
             Document object from the API
@@ -154,13 +279,81 @@ class GoogleDocsTransport:
         """
         document_id = self.extract_document_id(document_id)
 
-        result = (
-            self.service.documents()
-            .get(documentId=document_id, includeTabsContent=True)
-            .execute(num_retries=MAX_RETRIES)
+        cache_key = (document_id, fields)
+        cached = self._document_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < DOCUMENT_CACHE_TTL:
+            self._document_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached[1])
+
+        result = self.documents.get(documentId=document_id, includeTabsContent=True, fields=fields).execute(
+            num_retries=MAX_RETRIES
         )
+        self._cache_document(cache_key, result)
         return result
 
+    def _cache_document(self, cache_key: tuple[str, str | None], document: Document) -> None:
+        """Store a response, dropping expired entries and the least recently used beyond the cap."""
+        now = time.monotonic()
+        for key in [k for k, (stamp, _) in self._document_cache.items() if now - stamp >= DOCUMENT_CACHE_TTL]:
+            del self._document_cache[key]
+        self._document_cache[cache_key] = (now, document)
+        self._document_cache.move_to_end(cache_key)
+        while len(self._document_cache) > DOCUMENT_CACHE_SIZE:
+            self._document_cache.popitem(last=False)
+
+    def get_documents_parallel(
+        self,
+        document_ids: list[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        *,
+        fields: str | None = None,
+    ) -> dict[str, Document]:
+        """
+        Retrieve several documents concurrently using a thread pool.
+
+        httplib2 connections are not thread-safe, so each worker thread executes
+        its requests on its own ``AuthorizedHttp``.
+
+        Args:
+            document_ids: Document IDs or URLs
+            max_workers: Maximum number of concurrent requests
+            fields: Optional partial-response field mask applied to every request
+
+        Returns:
+            Dict mapping each (extracted) document ID to its Document object, in
+            input order
+
+        Raises:
+            HttpError: If any of the API requests fails
+            ValueError: If any document_id is invalid
+        """
+        ids = list(dict.fromkeys(self.extract_document_id(d) for d in document_ids))
+        documents = self.documents
+
+        def fetch(doc_id: str) -> Document:
+            request = documents.get(documentId=doc_id, includeTabsContent=True, fields=fields)
+            return request.execute(http=self._thread_http(), num_retries=MAX_RETRIES)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(ids, executor.map(fetch, ids), strict=True))
+
+    def _new_http(self) -> AuthorizedHttp:
+        """Return a fresh AuthorizedHttp over googleapiclient's ``build_http()``.
+
+        ``build_http()`` applies the library's default socket timeout and stops
+        httplib2 from following 308 responses, which the resumable upload protocol
+        uses for its own purposes.
+        """
+        return AuthorizedHttp(self.credentials, http=build_http())
+
+    def _thread_http(self) -> AuthorizedHttp:
+        """Return the calling thread's own AuthorizedHttp, creating it on first use."""
+        http: AuthorizedHttp | None = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = self._new_http()
+            self._thread_local.http = http
+        return http
+
     def create_document(self, document: Document) -> Document:
         """
         Create a new blank document.
@@ -171,28 +364,150 @@ class GoogleDocsTransport:
         Returns:
             The newly created document
         """
-        result = self.service.documents().create(body=document).execute(num_retries=MAX_RETRIES)
+        result = self.documents.create(body=document).execute(num_retries=MAX_RETRIES)
         return result
 
     def batch_update(self, document_id: str, requests: list[Request]) -> list[Response]:
         """
         Execute a batch update on a document.
 
+        Request lists longer than MAX_REQUESTS_PER_UPDATE are sent as consecutive
+        batchUpdate calls, in order, to stay under the API's request-size limit.
+        Each call is atomic on its own, but the update as a whole is not.
+
         Args:
             document_id: The document ID
             requests: List of Request objects for batchUpdate
 
         Returns:
-            List of responses from the API
+            List of responses from the API, one per request
         """
         document_id = self.extract_document_id(document_id)
+        self._invalidate_cached_document(document_id)
+
+        response_list: list[Response] = []
+        for chunk in _chunk_requests(requests):
+            result = self.documents.batchUpdate(documentId=document_id, body={"requests": chunk}).execute(
+                num_retries=MAX_RETRIES
+            )
+            # result is a BatchUpdateDocumentResponse TypedDict
+            response_list.extend(result.get("replies", []))
+        return response_list
+
+    def batch_get_documents(self, document_ids: list[str]) -> dict[str, Document]:
+        """
+        Retrieve several documents using batched HTTP requests.
+
+        Sub-requests are coalesced into multipart batch requests of at most
+        MAX_BATCH_SIZE documents each, so N documents cost ceil(N / 100) round-trips
+        instead of N.
+
+        Args:
+            document_ids: Document IDs or URLs
+
+        Returns:
+            Dict mapping each (extracted) document ID to its Document object
 
-        result = (
-            self.service.documents()
-            .batchUpdate(documentId=document_id, body={"requests": requests})
-            .execute(num_retries=MAX_RETRIES)
+        Raises:
+            HttpError: If any of the sub-requests fails
+            ValueError: If any document_id is invalid
+        """
+        ids = list(dict.fromkeys(self.extract_document_id(d) for d in document_ids))
+        documents = self.documents
+        return self._execute_batch(
+            {doc_id: documents.get(documentId=doc_id, includeTabsContent=True) for doc_id in ids}
         )
 
-        # result is a BatchUpdateDocumentResponse TypedDict
-        response_list = result.get("replies", [])
-        return response_list
+    def batch_update_documents(self, requests_by_document: dict[str, list[Request]]) -> dict[str, list[Response]]:
+        """
+        Execute batch updates against several documents using batched HTTP requests.
+
+        A document's request list longer than MAX_REQUESTS_PER_UPDATE is split into
+        consecutive batchUpdate calls. The server may run the sub-requests of one
+        batch in any order, so the chunks are sent in rounds: round N carries the
+        Nth chunk of every document and only starts once round N-1 has finished.
+
+        Args:
+            requests_by_document: Mapping of document ID (or URL) to the list of
+                                  Request objects for that document's batchUpdate
+
+        Returns:
+            Dict mapping each (extracted) document ID to its list of responses
+
+        Raises:
+            HttpError: If any of the sub-requests fails
+            ValueError: If any document ID is invalid
+        """
+        normalized = {self.extract_document_id(doc_id): requests for doc_id, requests in requests_by_document.items()}
+        for doc_id in normalized:
+            self._invalidate_cached_document(doc_id)
+        documents = self.documents
+        chunks = {doc_id: _chunk_requests(requests) for doc_id, requests in normalized.items()}
+        replies: dict[str, list[Response]] = {doc_id: [] for doc_id in normalized}
+        for round_index in range(max(map(len, chunks.values()), default=0)):
+            results = self._execute_batch(
+                {
+                    doc_id: documents.batchUpdate(documentId=doc_id, body={"requests": doc_chunks[round_index]})
+                    for doc_id, doc_chunks in chunks.items()
+                    if round_index < len(doc_chunks)
+                }
+            )
+            for doc_id, result in results.items():
+                replies[doc_id].extend(result.get("replies", []))
+        return replies
+
+    def _invalidate_cached_document(self, document_id: str) -> None:
+        """Drop every cached response (any field mask) for a document."""
+        for key in [k for k in self._document_cache if k[0] == document_id]:
+            del self._document_cache[key]
+
+    def _execute_batch(self, requests: dict[str, HttpRequest]) -> dict[str, Any]:
+        """Execute keyed sub-requests in chunks of MAX_BATCH_SIZE and collect the results.
+
+        Batch sub-requests do not get googleapiclient's ``num_retries`` handling, so
+        sub-requests failing with a retryable status are re-sent up to MAX_RETRIES
+        times with jittered exponential backoff. Raises the first remaining
+        sub-request error once every chunk has been executed.
+        """
+        results: dict[str, Any] = {}
+        errors: dict[str, Exception] = {}
+
+        def callback(request_id: str, response: Any, exception: Exception | None) -> None:
+            if exception is not None:
+                errors[request_id] = exception
+            else:
+                results[request_id] = response
+
+        pending = list(requests)
+        for attempt in range(MAX_RETRIES + 1):
+            for start in range(0, len(pending), MAX_BATCH_SIZE):
+                batch = self.service.new_batch_http_request(callback=callback)
+                for request_id in pending[start : start + MAX_BATCH_SIZE]:
+                    batch.add(requests[request_id], request_id=request_id)
+                batch.execute()
+
+            pending = [request_id for request_id, error in errors.items() if _is_retryable(error)]
+            if not pending or attempt == MAX_RETRIES:
+                break
+            for request_id in pending:
+                del errors[request_id]
+            time.sleep(random.uniform(0, RETRY_BASE_DELAY * 2**attempt))
+
+        if errors:
+            raise next(iter(errors.values()))
+        return results
+
+
+def _chunk_requests(requests: list[Request]) -> list[list[Request]]:
+    """Split a batchUpdate request list into ordered chunks of at most MAX_REQUESTS_PER_UPDATE.
+
+    An empty list yields a single empty chunk, so the document is still touched once.
+    """
+    return [
+        requests[start : start + MAX_REQUESTS_PER_UPDATE] for start in range(0, len(requests), MAX_REQUESTS_PER_UPDATE)
+    ] or [requests]
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Return True for rate-limit and server errors worth retrying."""
+    return isinstance(error, HttpError) and (error.resp.status == 429 or error.resp.status >= 500)
@@ -158,11 +158,11 @@ class Uploader:
             ``True`` if changes were applied, ``False`` if no changes detected.
         """
         from google_docs_markdown.diff_engine import DiffEngine
-        from google_docs_markdown.markdown_serializer import MarkdownSerializer
+        from google_docs_markdown.markdown_serializer import DOCUMENT_CONTENT_FIELDS, MarkdownSerializer
 
         serializer = MarkdownSerializer()
 
-        doc = self._client.get_document(document_id)
+        doc = self._client.get_document(document_id, fields=DOCUMENT_CONTENT_FIELDS)
         target_tab = _find_target_tab(doc, tab_id)
         if target_tab is None:
             raise ValueError(f"No tab found with tab_id={tab_id!r}")
@@ -223,14 +223,14 @@ class Uploader:
             Dict mapping tab path to whether changes were applied.
         """
         from google_docs_markdown.diff_engine import DiffEngine
-        from google_docs_markdown.markdown_serializer import MarkdownSerializer
+        from google_docs_markdown.markdown_serializer import DOCUMENT_CONTENT_FIELDS, MarkdownSerializer
 
         directory = Path(directory_path)
         if not directory.is_dir():
             raise FileNotFoundError(f"Directory not found: {directory}")
 
         serializer = MarkdownSerializer()
-        doc = self._client.get_document(document_id)
+        doc = self._client.get_document(document_id, fields=DOCUMENT_CONTENT_FIELDS)
         engine = DiffEngine()
         results: dict[str, bool] = {}
 
@@ -13,17 +13,34 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
-from google_docs_markdown.transport import GoogleDocsTransport
+if TYPE_CHECKING:
+    from google_docs_markdown.transport import GoogleDocsTransport
 
 app = typer.Typer()
 
 DEFAULT_OUTPUT_DIR = Path(__file__).parent.parent / "tests" / "resources" / "document_jsons"
 
 
+class _TitleCharMap(dict[int, int]):
+    """``str.translate`` table turning a title into a fixture filename, filled in lazily.
+
+    Letters, digits, ``-`` and ``_`` are kept; spaces and everything else become ``_``.
+    """
+
+    def __missing__(self, codepoint: int) -> int:
+        char = chr(codepoint)
+        mapped = codepoint if char.isalnum() or char in "-_" else ord("_")
+        self[codepoint] = mapped
+        return mapped
+
+
+_TITLE_CHAR_MAP = _TitleCharMap()
+
+
 def download_document(
     client: GoogleDocsTransport,
     document: str,
@@ -45,8 +62,7 @@ def download_document(
         output_filename = output
     else:
         title = doc.get("title", "Untitled Document")
-        safe_title = "".join(c if c.isalnum() or c in (" ", "-", "_") else "_" for c in title)
-        safe_title = safe_title.replace(" ", "_")
+        safe_title = title.translate(_TITLE_CHAR_MAP)
         output_filename = f"{safe_title}.json"
 
     output_path = output_dir_path / output_filename
@@ -57,11 +73,9 @@ def download_document(
             raise typer.Exit()
 
     typer.echo(f"Saving to: {output_path}")
-    with output_path.open("w", encoding="utf-8") as f:
-        if pretty:
-            json.dump(doc, f, indent=2, ensure_ascii=False)
-        else:
-            json.dump(doc, f, ensure_ascii=False)
+    # json.dumps encodes in one shot with the C encoder; json.dump streams
+    # thousands of small chunks through the text layer
+    output_path.write_bytes(json.dumps(doc, indent=2 if pretty else None, ensure_ascii=False).encode("utf-8"))
 
     typer.echo(f"✓ Successfully downloaded document: {doc.get('title', 'Untitled')}")
     typer.echo(f"  Saved to: {output_path}")
@@ -138,6 +152,9 @@ def main(
     output_dir_path = output_dir if output_dir is not None else DEFAULT_OUTPUT_DIR
     output_dir_path.mkdir(parents=True, exist_ok=True)
 
+    # Imported here so --help and argument errors don't load the API client
+    from google_docs_markdown.transport import GoogleDocsTransport
+
     typer.echo("Connecting to Google Docs API...")
     client = GoogleDocsTransport()
 
@@ -6,6 +6,8 @@ Tests that commands exist and are properly configured.
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import ANY, Mock, patch
 
@@ -31,6 +33,28 @@ class TestCLICommands:
         mock_setup_module.assert_called_once()
 
 
+class TestLazyImports:
+    """Test that importing the CLI does not load the Google API stack."""
+
+    def test_cli_import_skips_heavy_dependencies(self) -> None:
+        """Test that googleapiclient, google.auth and pydantic are imported on demand."""
+        code = (
+            "import sys, google_docs_markdown.cli; "
+            "print(','.join(m for m in ('googleapiclient', 'google.auth', 'pydantic') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == ""
+
+    def test_package_exports_resolve_lazily(self) -> None:
+        """Test that public names are still importable from the package root."""
+        import google_docs_markdown
+        from google_docs_markdown.downloader import Downloader
+
+        assert google_docs_markdown.Downloader is Downloader
+        with raises(AttributeError):
+            _ = google_docs_markdown.NotAThing  # type: ignore[attr-defined]
+
+
 class TestDownloadCommand:
     """Test the download command wiring."""
 
@@ -131,6 +155,91 @@ class TestDownloadCommand:
             cli.download(document_url="doc-id", output="/out", tabs=None)
 
 
+class TestDownloadManyCommand:
+    """Test the download-many command wiring."""
+
+    @patch("google_docs_markdown.downloader.Downloader")
+    def test_delegates_to_download_many(self, mock_dl_cls: Mock) -> None:
+        """Test that the command hands every document to Downloader.download_many."""
+        mock_dl = mock_dl_cls.return_value
+        mock_dl.download_many.return_value = {
+            "doc-a": {"Tab": Path("/out/A/Tab.md")},
+            "doc-b": {"Tab": Path("/out/B/Tab.md")},
+        }
+
+        with patch("google_docs_markdown.cli._prompt_stale_cleanup") as mock_cleanup:
+            cli.download_many(document_urls=["doc-a", "doc-b"], output="/out", force=True, workers=3)
+
+        mock_dl.download_many.assert_called_once_with(
+            ["doc-a", "doc-b"], "/out", overwrite=True, max_workers=3, confirm_overwrite=cli._confirm_overwrite
+        )
+        assert mock_cleanup.call_count == 2
+
+    @patch("google_docs_markdown.downloader.Downloader")
+    def test_fetch_error_exits(self, mock_dl_cls: Mock) -> None:
+        """Test that a failed download exits with an error."""
+        import click
+
+        mock_dl = mock_dl_cls.return_value
+        mock_dl.download_many.side_effect = RuntimeError("API error")
+
+        with raises((SystemExit, click.exceptions.Exit)):
+            cli.download_many(document_urls=["doc-a"], output="/out")
+
+    @patch("google_docs_markdown.cli.typer.confirm", return_value=False)
+    @patch("google_docs_markdown.downloader.GoogleDocsClient")
+    def test_declined_overwrite_aborts(self, mock_client_cls: Mock, mock_confirm: Mock, tmp_path: Path) -> None:
+        """Test that existing files are only replaced after confirmation."""
+        import click
+
+        from google_docs_markdown.models import Document
+
+        doc = Document.model_validate(
+            {
+                "documentId": "doc-a",
+                "title": "Notes",
+                "tabs": [{"tabProperties": {"tabId": "t.0", "title": "Tab"}, "documentTab": {"body": {"content": []}}}],
+            }
+        )
+        mock_client_cls.return_value.get_documents_parallel.return_value = {"doc-a": doc}
+        (tmp_path / "Notes").mkdir()
+        (tmp_path / "Notes" / "Tab.md").write_text("previous", encoding="utf-8")
+
+        with raises(click.exceptions.Abort):
+            cli.download_many(document_urls=["doc-a"], output=str(tmp_path))
+
+        mock_confirm.assert_called_once_with("Overwrite?")
+        assert (tmp_path / "Notes" / "Tab.md").read_text(encoding="utf-8") == "previous"
+
+    @patch("google_docs_markdown.downloader.GoogleDocsClient")
+    def test_same_titles_with_force_keep_all_files(self, mock_client_cls: Mock, tmp_path: Path) -> None:
+        """Test that documents sharing a title never see each other's files as stale."""
+        from google_docs_markdown.models import Document
+
+        def _doc(document_id: str, tab_titles: list[str]) -> Document:
+            tabs = [
+                {
+                    "tabProperties": {"tabId": f"t.{i}", "title": title},
+                    "documentTab": {"body": {"content": []}},
+                }
+                for i, title in enumerate(tab_titles)
+            ]
+            return Document.model_validate({"documentId": document_id, "title": "Untitled document", "tabs": tabs})
+
+        mock_client_cls.return_value.get_documents_parallel.return_value = {
+            "doc-a": _doc("doc-a", ["Notes", "Plan"]),
+            "doc-b": _doc("doc-b", ["Tab 1"]),
+        }
+
+        cli.download_many(document_urls=["doc-a", "doc-b"], output=str(tmp_path), force=True)
+
+        assert sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*.md")) == [
+            "Untitled document (doc-a)/Notes.md",
+            "Untitled document (doc-a)/Plan.md",
+            "Untitled document (doc-b)/Tab 1.md",
+        ]
+
+
 class TestStaleFileCleanup:
     """Test the stale file detection and cleanup prompt."""
 
@@ -190,6 +190,22 @@ class TestBatchUpdate:
         assert "requests" in call_args.kwargs["body"]
 
 
+class TestBatchGetDocuments:
+    """Test typed multi-document retrieval via GoogleDocsClient."""
+
+    def test_batch_get_documents_returns_pydantic_models(self) -> None:
+        """Test that each raw document is converted to a Document model."""
+        transport = Mock()
+        transport.batch_get_documents.return_value = {"doc-id-aaaaa": {"title": "A"}}
+
+        client = GoogleDocsClient(transport)
+        result = client.batch_get_documents(["doc-id-aaaaa"])
+
+        assert isinstance(result["doc-id-aaaaa"], Document)
+        assert result["doc-id-aaaaa"].title == "A"
+        transport.batch_get_documents.assert_called_once_with(["doc-id-aaaaa"])
+
+
 class TestExtractDocumentId:
     """Test that extract_document_id is properly delegated."""
 
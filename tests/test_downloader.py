@@ -7,9 +7,11 @@ directory/file creation, filename sanitization, and selective tab download.
 from __future__ import annotations
 
 import json
+import os
+import stat
 from pathlib import Path
 from typing import Any, cast
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -17,10 +19,12 @@ from google_docs_markdown.downloader import (
     Downloader,
     FileConflictError,
     TabSummary,
+    _current_umask,
     find_stale_files,
     remove_empty_dirs,
     sanitize_filename,
 )
+from google_docs_markdown.markdown_serializer import DOCUMENT_CONTENT_FIELDS, DOCUMENT_SUMMARY_FIELDS
 from google_docs_markdown.models import Document
 
 RESOURCES_DIR = Path(__file__).parent / "resources" / "document_jsons"
@@ -129,7 +133,14 @@ class TestDownloaderDownload:
         client = _mock_client(_load_raw(SINGLE_TAB_JSON))
         dl = Downloader(client=client)
         dl.download("my-doc-id")
-        client.get_document.assert_called_once_with("my-doc-id")
+        client.get_document.assert_called_once_with("my-doc-id", fields=DOCUMENT_CONTENT_FIELDS)
+
+    def test_content_mask_skips_unrendered_fields(self) -> None:
+        """The download mask keeps what the serializer renders and drops style/suggestion maps."""
+        for field in ("body", "footers", "footnotes", "headers", "inlineObjects", "lists", "namedStyles"):
+            assert field in DOCUMENT_CONTENT_FIELDS
+        for field in ("documentStyle", "namedRanges", "positionedObjects", "suggested"):
+            assert field not in DOCUMENT_CONTENT_FIELDS
 
 
 # ---------------------------------------------------------------------------
@@ -137,7 +148,147 @@ class TestDownloaderDownload:
 # ---------------------------------------------------------------------------
 
 
+class TestDownloaderDownloadMany:
+    def test_writes_each_document(self, tmp_path: Path) -> None:
+        """Documents are fetched in one parallel call and each written to its own directory."""
+        client = MagicMock()
+        client.get_documents_parallel.return_value = {
+            "single-id": Document.model_validate(_load_raw(SINGLE_TAB_JSON)),
+            "multi-id": Document.model_validate(_load_raw(MULTI_TAB_JSON)),
+        }
+        dl = Downloader(client=client)
+
+        written = dl.download_many(["single-id", "multi-id"], output_dir=tmp_path, max_workers=2)
+
+        client.get_documents_parallel.assert_called_once_with(
+            ["single-id", "multi-id"], max_workers=2, fields=DOCUMENT_CONTENT_FIELDS
+        )
+        client.get_document.assert_not_called()
+        assert list(written) == ["single-id", "multi-id"]
+        assert written["single-id"]["First tab"].parent == tmp_path / "Markdown Conversion Example - Single-Tab"
+        assert all(p.exists() for paths in written.values() for p in paths.values())
+
+    def test_confirm_overwrite_decides_conflicts(self, tmp_path: Path) -> None:
+        """Existing files are replaced only when confirm_overwrite approves."""
+        doc = Document.model_validate(_load_raw(SINGLE_TAB_JSON))
+        client = MagicMock()
+        client.get_documents_parallel.return_value = {"id": doc}
+        dl = Downloader(client=client)
+        target = tmp_path / "Markdown Conversion Example - Single-Tab" / "First tab.md"
+        target.parent.mkdir()
+        target.write_text("previous", encoding="utf-8")
+
+        with pytest.raises(FileConflictError):
+            dl.download_many(["id"], output_dir=tmp_path, overwrite=False, confirm_overwrite=lambda paths: False)
+        assert target.read_text(encoding="utf-8") == "previous"
+
+        confirmed: list[list[Path]] = []
+
+        def approve(paths: list[Path]) -> bool:
+            confirmed.append(paths)
+            return True
+
+        dl.download_many(["id"], output_dir=tmp_path, overwrite=False, confirm_overwrite=approve)
+        assert confirmed == [[target]]
+        assert target.read_text(encoding="utf-8") != "previous"
+
+    def test_same_titles_get_separate_directories(self, tmp_path: Path) -> None:
+        """Documents whose titles collide are written to directories suffixed with their IDs."""
+        doc_a = Document.model_validate({**_load_raw(SINGLE_TAB_JSON), "documentId": "id-a", "title": "Notes"})
+        doc_b = Document.model_validate({**_load_raw(MULTI_TAB_JSON), "documentId": "id-b", "title": "notes"})
+        client = MagicMock()
+        client.get_documents_parallel.return_value = {"id-a": doc_a, "id-b": doc_b}
+        dl = Downloader(client=client)
+
+        written = dl.download_many(["id-a", "id-b"], output_dir=tmp_path)
+
+        assert written["id-a"]["First tab"].parent == tmp_path / "Notes (id-a)"
+        assert written["id-b"]["First tab"].parent == tmp_path / "notes (id-b)"
+        assert len(list((tmp_path / "Notes (id-a)").rglob("*.md"))) == 1
+        assert len(list((tmp_path / "notes (id-b)").rglob("*.md"))) == 4
+
+    def test_same_document_listed_twice_is_written_once(self, tmp_path: Path) -> None:
+        """A document given both by URL and by ID is written once under its own title."""
+        doc = Document.model_validate(_load_raw(SINGLE_TAB_JSON))
+        client = MagicMock()
+        client.get_documents_parallel.return_value = {"url": doc, "id": doc}
+        dl = Downloader(client=client)
+
+        written = dl.download_many(["url", "id"], output_dir=tmp_path)
+
+        assert list(written) == ["url"]
+        assert written["url"]["First tab"].parent == tmp_path / "Markdown Conversion Example - Single-Tab"
+
+
 class TestDownloaderDownloadToFiles:
+    def test_writes_utf8_with_lf_newlines(self, tmp_path: Path) -> None:
+        """Files hold the serialized Markdown byte-for-byte as UTF-8 with LF line endings."""
+        client = _mock_client(_load_raw(SINGLE_TAB_JSON))
+        dl = Downloader(client=client)
+
+        written = dl.download_to_files("fake-id", output_dir=tmp_path)
+
+        expected = dl.download("fake-id")["First tab"]
+        assert written["First tab"].read_bytes() == expected.encode("utf-8")
+        assert b"\r\n" not in written["First tab"].read_bytes()
+
+    def test_failed_write_keeps_previous_file(self, tmp_path: Path) -> None:
+        """A write that fails midway leaves the old file intact and no temp file behind."""
+        client = _mock_client(_load_raw(SINGLE_TAB_JSON))
+        dl = Downloader(client=client)
+        doc_root = tmp_path / "Markdown Conversion Example - Single-Tab"
+        doc_root.mkdir()
+        (doc_root / "First tab.md").write_text("previous", encoding="utf-8")
+
+        with patch("google_docs_markdown.downloader.os.write", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                dl.download_to_files("fake-id", output_dir=tmp_path)
+
+        assert (doc_root / "First tab.md").read_text(encoding="utf-8") == "previous"
+        assert sorted(p.name for p in doc_root.iterdir()) == ["First tab.md"]
+
+    def test_failed_replace_removes_temp_file(self, tmp_path: Path) -> None:
+        """A rename that fails leaves the old file intact and no temp file behind."""
+        client = _mock_client(_load_raw(SINGLE_TAB_JSON))
+        dl = Downloader(client=client)
+        doc_root = tmp_path / "Markdown Conversion Example - Single-Tab"
+        doc_root.mkdir()
+        (doc_root / "First tab.md").write_text("previous", encoding="utf-8")
+
+        with patch("google_docs_markdown.downloader.os.replace", side_effect=OSError("busy")):
+            with pytest.raises(OSError, match="busy"):
+                dl.download_to_files("fake-id", output_dir=tmp_path)
+
+        assert (doc_root / "First tab.md").read_text(encoding="utf-8") == "previous"
+        assert sorted(p.name for p in doc_root.iterdir()) == ["First tab.md"]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_overwrite_keeps_file_mode(self, tmp_path: Path) -> None:
+        """Replacing a file keeps its permissions; new files get the umask-derived mode."""
+        client = _mock_client(_load_raw(MULTI_TAB_JSON))
+        dl = Downloader(client=client)
+        written = dl.download_to_files("fake-id", output_dir=tmp_path)
+        first, second = list(written.values())[:2]
+        umask = os.umask(0o022)
+        os.umask(umask)
+        assert stat.S_IMODE(second.stat().st_mode) == 0o666 & ~umask
+        first.chmod(0o640)
+
+        dl.download_to_files("fake-id", output_dir=tmp_path)
+
+        assert stat.S_IMODE(first.stat().st_mode) == 0o640
+        assert stat.S_IMODE(second.stat().st_mode) == 0o666 & ~umask
+
+    @pytest.mark.skipif(not Path("/proc/self/status").exists(), reason="needs /proc")
+    def test_umask_changes_are_seen(self) -> None:
+        """The umask is re-read on use instead of being frozen at the first write."""
+        previous = os.umask(0o077)
+        try:
+            assert _current_umask() == 0o077
+        finally:
+            os.umask(previous)
+        assert _current_umask() == previous
+
     def test_creates_directory_from_title(self, tmp_path: Path) -> None:
         client = _mock_client(_load_raw(SINGLE_TAB_JSON))
         dl = Downloader(client=client)
@@ -351,6 +502,16 @@ class TestGetDocumentTitle:
         dl = Downloader(client=client)
         assert dl.get_document_title("fake-id") == "Markdown Conversion Example - Single-Tab"
 
+    def test_requests_summary_fields_only(self) -> None:
+        client = _mock_client(_load_raw(SINGLE_TAB_JSON))
+        dl = Downloader(client=client)
+        dl.get_document_title("fake-id")
+        dl.get_tabs("fake-id")
+
+        for call in client.get_document.call_args_list:
+            assert call.kwargs["fields"] == DOCUMENT_SUMMARY_FIELDS
+        assert "content" not in DOCUMENT_SUMMARY_FIELDS
+
     def test_returns_fallback_for_none(self) -> None:
         raw = _load_raw(SINGLE_TAB_JSON)
         raw["title"] = None
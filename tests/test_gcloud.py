@@ -7,11 +7,43 @@ Tests gcloud command execution, error handling, and exception raising.
 from __future__ import annotations
 
 import subprocess
+from collections.abc import Iterator
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
-from google_docs_markdown.gcloud import GCloudException, gcloud_exec, gcloud_run
+from google_docs_markdown import gcloud
+from google_docs_markdown.gcloud import (
+    RUN_CACHE_TTL,
+    GCloudException,
+    application_default_credentials_path,
+    gcloud_exec,
+    gcloud_run,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_run_cache() -> Iterator[None]:
+    """Keep cached gcloud_run output from leaking between tests."""
+    gcloud._run_cache.clear()
+    yield
+    gcloud._run_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def gcloud_config_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point gcloud at an empty config directory so the developer's real config is never read."""
+    config_dir = tmp_path / "gcloud"
+    monkeypatch.setenv("CLOUDSDK_CONFIG", str(config_dir))
+    monkeypatch.delenv("CLOUDSDK_ACTIVE_CONFIG_NAME", raising=False)
+    monkeypatch.delenv("CLOUDSDK_CORE_PROJECT", raising=False)
+    return config_dir
+
+
+def _write_config(config_dir: Path, name: str, body: str) -> None:
+    (config_dir / "configurations").mkdir(parents=True, exist_ok=True)
+    (config_dir / "configurations" / f"config_{name}").write_text(body, encoding="utf-8")
 
 
 class TestGCloudException:
@@ -244,6 +276,174 @@ class TestGcloudRun:
         assert call_args[0][0] == ["gcloud", "config", "get-value", "project"]
 
 
+class TestGcloudRunCache:
+    """Test opt-in caching of read-only gcloud_run calls."""
+
+    @patch("google_docs_markdown.gcloud.subprocess.run")
+    def test_cached_call_runs_gcloud_once(self, mock_run: Mock) -> None:
+        """Test that a repeated cached command is served from memory."""
+        mock_run.return_value = Mock(stdout="my-project\n")
+
+        first = gcloud_run(["config", "get-value", "project"], operation="getting project", cache=True)
+        second = gcloud_run(["config", "get-value", "project"], operation="getting project", cache=True)
+
+        assert first == second == "my-project"
+        mock_run.assert_called_once()
+
+    @patch("google_docs_markdown.gcloud.subprocess.run")
+    def test_uncached_call_always_runs(self, mock_run: Mock) -> None:
+        """Test that caching is opt-in."""
+        mock_run.return_value = Mock(stdout="out")
+
+        gcloud_run(["config", "get-value", "project"], operation="getting project")
+        gcloud_run(["config", "get-value", "project"], operation="getting project")
+
+        assert mock_run.call_count == 2
+
+    @patch("google_docs_markdown.gcloud.time.monotonic")
+    @patch("google_docs_markdown.gcloud.subprocess.run")
+    def test_entry_expires_after_ttl(self, mock_run: Mock, mock_monotonic: Mock) -> None:
+        """Test that cached output is refreshed once the TTL has passed."""
+        mock_run.return_value = Mock(stdout="out")
+        mock_monotonic.side_effect = [0.0, RUN_CACHE_TTL + 1, RUN_CACHE_TTL + 1]
+
+        gcloud_run(["--version"], operation="checking", cache=True)
+        gcloud_run(["--version"], operation="checking", cache=True)
+
+        assert mock_run.call_count == 2
+
+    @patch("google_docs_markdown.gcloud.typer.echo")
+    @patch("google_docs_markdown.gcloud.subprocess.run")
+    def test_failures_are_not_cached(self, mock_run: Mock, mock_echo: Mock) -> None:
+        """Test that a failed command is retried on the next call."""
+        mock_run.side_effect = [subprocess.CalledProcessError(1, "gcloud"), Mock(stdout="out")]
+
+        assert gcloud_run(["--version"], operation="checking", raise_exception=False, cache=True) is None
+        assert gcloud_run(["--version"], operation="checking", cache=True) == "out"
+
+    @patch("google_docs_markdown.gcloud.subprocess.run")
+    def test_exec_clears_cache(self, mock_run: Mock) -> None:
+        """Test that gcloud_exec invalidates cached reads."""
+        mock_run.return_value = Mock(stdout="old-project")
+        gcloud_run(["config", "get-value", "project"], operation="getting project", cache=True)
+
+        gcloud_exec(["config", "set", "project", "new-project"], operation="setting project")
+        mock_run.return_value = Mock(stdout="new-project")
+
+        assert gcloud_run(["config", "get-value", "project"], operation="getting project", cache=True) == "new-project"
+
+
+class TestGcloudRunRetries:
+    """Test retrying read-only gcloud_run calls after transient failures."""
+
+    @staticmethod
+    def _failure(stderr: str) -> subprocess.CalledProcessError:
+        return subprocess.CalledProcessError(returncode=1, cmd=["gcloud", "projects", "list"], stderr=stderr)
+
+    @patch("google_docs_markdown.gcloud.time.sleep")
+    @patch("google_docs_markdown.gcloud.subprocess.run")
+    def test_transient_failure_is_retried(self, mock_run: Mock, mock_sleep: Mock) -> None:
+        """Test that a transient error is retried with backoff and the later result returned."""
+        mock_run.side_effect = [
+            self._failure("ERROR: (gcloud.projects.list) UNAVAILABLE: The service is currently unavailable."),
+            Mock(stdout="project-1\n"),
+        ]
+
+        result = gcloud_run(["projects", "list"], operation="listing projects", retries=2)
+
+        assert result == "project-1"
+        assert mock_run.call_count == 2
+        mock_sleep.assert_called_once()
+
+    @patch("google_docs_markdown.gcloud.time.sleep")
+    @patch("google_docs_markdown.gcloud.subprocess.run")
+    def test_permanent_failure_is_not_retried(self, mock_run: Mock, mock_sleep: Mock) -> None:
+        """Test that a non-transient error fails immediately."""
+        mock_run.side_effect = self._failure("ERROR: (gcloud.projects.list) PERMISSION_DENIED")
+
+        with pytest.raises(GCloudException):
+            gcloud_run(["projects", "list"], operation="listing projects", retries=2)
+
+        mock_run.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch("google_docs_markdown.gcloud.time.sleep")
+    @patch("google_docs_markdown.gcloud.subprocess.run")
+    def test_gives_up_after_retries(self, mock_run: Mock, mock_sleep: Mock) -> None:
+        """Test that the last transient error is reported once retries are exhausted."""
+        mock_run.side_effect = self._failure("ERROR: gcloud crashed (HTTPError 503)")
+
+        assert gcloud_run(["projects", "list"], operation="listing projects", retries=2, raise_exception=False) is None
+
+        assert mock_run.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch("google_docs_markdown.gcloud.time.sleep")
+    @patch("google_docs_markdown.gcloud.subprocess.run")
+    def test_no_retries_by_default(self, mock_run: Mock, mock_sleep: Mock) -> None:
+        """Test that retrying is opt-in."""
+        mock_run.side_effect = self._failure("UNAVAILABLE")
+
+        with pytest.raises(GCloudException):
+            gcloud_run(["projects", "list"], operation="listing projects")
+
+        mock_run.assert_called_once()
+        mock_sleep.assert_not_called()
+
+
+class TestConfigFastPath:
+    """Test resolving ``config get-value`` from the gcloud config files."""
+
+    def test_application_default_credentials_path(self, gcloud_config_dir: Path) -> None:
+        """Test that the ADC file lives in the resolved gcloud config directory."""
+        assert application_default_credentials_path() == gcloud_config_dir / "application_default_credentials.json"
+
+    @patch("google_docs_markdown.gcloud.subprocess.run")
+    def test_reads_active_configuration(self, mock_run: Mock, gcloud_config_dir: Path) -> None:
+        """Test that the property is read from the active named configuration."""
+        _write_config(gcloud_config_dir, "work", "[core]\nproject = work-project\n")
+        (gcloud_config_dir / "active_config").write_text("work\n", encoding="utf-8")
+
+        assert gcloud_run(["config", "get-value", "project"], operation="getting project") == "work-project"
+        mock_run.assert_not_called()
+
+    @patch("google_docs_markdown.gcloud.subprocess.run")
+    def test_sectioned_property(self, mock_run: Mock, gcloud_config_dir: Path) -> None:
+        """Test that ``section/name`` properties are looked up in their section."""
+        _write_config(gcloud_config_dir, "default", "[compute]\nregion = europe-west1\n")
+
+        assert gcloud_run(["config", "get-value", "compute/region"], operation="getting region") == "europe-west1"
+        mock_run.assert_not_called()
+
+    @patch("google_docs_markdown.gcloud.subprocess.run")
+    def test_environment_override_wins(
+        self, mock_run: Mock, gcloud_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that CLOUDSDK_CORE_PROJECT takes precedence over the config file."""
+        _write_config(gcloud_config_dir, "default", "[core]\nproject = file-project\n")
+        monkeypatch.setenv("CLOUDSDK_CORE_PROJECT", "env-project")
+
+        assert gcloud_run(["config", "get-value", "project"], operation="getting project") == "env-project"
+        mock_run.assert_not_called()
+
+    @patch("google_docs_markdown.gcloud.subprocess.run")
+    def test_falls_back_to_gcloud_when_unset(self, mock_run: Mock, gcloud_config_dir: Path) -> None:
+        """Test that gcloud is spawned when the files do not define the property."""
+        _write_config(gcloud_config_dir, "default", "[core]\naccount = me@example.com\n")
+        mock_run.return_value = Mock(stdout="installation-project\n")
+
+        assert gcloud_run(["config", "get-value", "project"], operation="getting project") == "installation-project"
+        mock_run.assert_called_once()
+
+    @patch("google_docs_markdown.gcloud.subprocess.run")
+    def test_falls_back_on_malformed_file(self, mock_run: Mock, gcloud_config_dir: Path) -> None:
+        """Test that an unparsable config file is handed to gcloud."""
+        _write_config(gcloud_config_dir, "default", "project = no-section\n")
+        mock_run.return_value = Mock(stdout="from-gcloud")
+
+        assert gcloud_run(["config", "get-value", "project"], operation="getting project") == "from-gcloud"
+
+
 class TestGcloudExec:
     """Test gcloud_exec function."""
 
@@ -360,6 +560,37 @@ class TestGcloudExec:
         assert error_call.kwargs.get("err") is True
         assert "setting project" in error_call.args[0]
 
+    @patch("google_docs_markdown.gcloud.subprocess.run")
+    def test_quiet_discards_stdout(self, mock_run: Mock) -> None:
+        """Test that quiet=True discards stdout and captures stderr."""
+        mock_run.return_value = Mock(returncode=0)
+
+        result = gcloud_exec(["services", "enable", "docs.googleapis.com"], operation="enabling API", quiet=True)
+
+        assert result is True
+        mock_run.assert_called_once_with(
+            ["gcloud", "services", "enable", "docs.googleapis.com"],
+            check=True,
+            timeout=None,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+    @patch("google_docs_markdown.gcloud.subprocess.run")
+    def test_quiet_error_includes_stderr(self, mock_run: Mock) -> None:
+        """Test that captured stderr is included in the error message."""
+        mock_run.side_effect = subprocess.CalledProcessError(
+            returncode=1,
+            cmd=["gcloud", "services", "enable", "docs.googleapis.com"],
+            stderr="ERROR: (gcloud.services.enable) PERMISSION_DENIED\n",
+        )
+
+        with pytest.raises(GCloudException) as exc_info:
+            gcloud_exec(["services", "enable", "docs.googleapis.com"], operation="enabling API", quiet=True)
+
+        assert exc_info.value.message.endswith("ERROR: (gcloud.services.enable) PERMISSION_DENIED")
+
     @patch("google_docs_markdown.gcloud.subprocess.run")
     @patch("google_docs_markdown.gcloud.typer.echo")
     def test_timeout_expired_with_raise_exception_true(self, mock_echo: Mock, mock_run: Mock) -> None:
@@ -60,11 +60,9 @@ class TestDeserializerParagraphs:
     def test_multiple_paragraphs(self) -> None:
         requests = deserialize("First paragraph.\n\nSecond paragraph.\n")
         inserts = _find_all_requests(requests, "insertText")
-        assert len(inserts) == 2
+        assert len(inserts) == 1
         assert inserts[0].insertText is not None
-        assert inserts[0].insertText.text == "First paragraph.\n"
-        assert inserts[1].insertText is not None
-        assert inserts[1].insertText.text == "Second paragraph.\n"
+        assert inserts[0].insertText.text == "First paragraph.\nSecond paragraph.\n"
 
     def test_empty_input(self) -> None:
         requests = deserialize("")
@@ -147,11 +145,9 @@ class TestDeserializerLists:
     def test_unordered_list(self) -> None:
         requests = deserialize("- item 1\n- item 2\n")
         inserts = _find_all_requests(requests, "insertText")
-        assert len(inserts) == 2
+        assert len(inserts) == 1
         assert inserts[0].insertText is not None
-        assert inserts[0].insertText.text == "item 1\n"
-        assert inserts[1].insertText is not None
-        assert inserts[1].insertText.text == "item 2\n"
+        assert inserts[0].insertText.text == "item 1\nitem 2\n"
 
         bullets = _find_all_requests(requests, "createParagraphBullets")
         assert len(bullets) == 2
@@ -339,6 +335,37 @@ class TestDeserializerEdgeCases:
         assert indices == sorted(indices)
 
 
+class TestDeserializerInsertCoalescing:
+    def test_document_is_one_insert_followed_by_styles(self) -> None:
+        """Contiguous blocks become a single insert; style ranges keep their final indices."""
+        requests = deserialize("# Title\n\nSome **bold** text.\n\n- item\n")
+        assert requests[0].insertText is not None
+        assert requests[0].insertText.text == "Title\nSome bold text.\nitem\n"
+        assert _find_all_requests(requests, "insertText") == [requests[0]]
+
+        heading = _find_request(requests, "updateParagraphStyle")
+        assert heading is not None and heading.updateParagraphStyle is not None
+        assert heading.updateParagraphStyle.range is not None
+        assert heading.updateParagraphStyle.range.startIndex == 1
+        assert heading.updateParagraphStyle.range.endIndex == 6
+
+        bold = _find_request(requests, "updateTextStyle")
+        assert bold is not None and bold.updateTextStyle is not None
+        assert bold.updateTextStyle.range is not None
+        assert bold.updateTextStyle.range.startIndex == 12
+        assert bold.updateTextStyle.range.endIndex == 16
+
+    def test_non_text_request_breaks_the_run(self) -> None:
+        """Inserts on either side of a page break stay separate and in order."""
+        requests = deserialize("Before\n\n<!-- page-break -->\n\nAfter\n")
+        assert len(requests) == 3
+        assert requests[0].insertText is not None
+        assert requests[0].insertText.text == "Before\n"
+        assert requests[1].insertPageBreak is not None
+        assert requests[2].insertText is not None
+        assert requests[2].insertText.text == "After\n"
+
+
 class TestDeserializerRichLink:
     def test_rich_link_tag_produces_insert_and_style(self) -> None:
         md = (
@@ -434,7 +461,9 @@ class TestDeserializerTagsInLists:
         requests = deserialize(md)
         assert _find_request(requests, "insertPerson") is None
         inserts = _find_all_requests(requests, "insertText")
-        assert len(inserts) == 2
+        assert len(inserts) == 1
+        assert inserts[0].insertText is not None
+        assert inserts[0].insertText.text == "plain item 1\nplain item 2\n"
 
 
 class TestDeserializerTagsInHeadings:
@@ -214,6 +214,12 @@ class TestSerializerBasic:
         result = serializer.serialize(doc_tab)
         assert result == "Hello world\n"
 
+    def test_empty_text_style_is_plain_text(self, serializer: MarkdownSerializer) -> None:
+        """A run with ``textStyle: {}`` renders exactly like one with no style."""
+        para = Paragraph(elements=[ParagraphElement(textRun=TextRun(content="plain\n", textStyle=TextStyle()))])
+        doc_tab = DocumentTab(body=Body(content=[StructuralElement(paragraph=para)]))
+        assert serializer.serialize(doc_tab) == "plain\n"
+
     def test_title(self, serializer: MarkdownSerializer) -> None:
         doc_tab = _make_doc_tab([("My Document", "TITLE")])
         result = serializer.serialize(doc_tab)
@@ -7,17 +7,22 @@ Tests authentication checks, project configuration, and API enablement.
 from __future__ import annotations
 
 from collections.abc import Iterator
+from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from google.auth.exceptions import DefaultCredentialsError
+from googleapiclient.errors import HttpError
 
 from google_docs_markdown.setup import (
+    ADC_CACHE_TTL,
     DOCS_API_SERVICE,
+    READ_RETRIES,
     REQUIRED_SCOPES,
     check_api_enabled,
     check_credentials_exist,
     check_gcloud_installed,
+    clear_setup_caches,
     enable_docs_api,
     get_current_project,
     list_available_projects,
@@ -28,30 +33,62 @@ from google_docs_markdown.setup import (
 )
 
 
+@pytest.fixture(autouse=True)
+def no_application_default_credentials() -> Iterator[Mock]:
+    """Make the direct Service Usage API check fall back to gcloud unless a test opts in."""
+    clear_setup_caches()
+    with patch("google_docs_markdown.setup.default", side_effect=DefaultCredentialsError("No credentials")) as mock:
+        yield mock
+
+
 class TestCheckGcloudInstalled:
     """Test gcloud installation check."""
 
-    @patch("google_docs_markdown.setup.gcloud_run")
-    def test_gcloud_installed(self, mock_gcloud_run: Mock) -> None:
+    @patch("google_docs_markdown.setup.shutil.which")
+    def test_gcloud_installed(self, mock_which: Mock) -> None:
         """Test when gcloud is installed."""
-        mock_gcloud_run.return_value = "gcloud version output"
+        mock_which.return_value = "/usr/bin/gcloud"
         assert check_gcloud_installed() is True
-        mock_gcloud_run.assert_called_once_with(
-            ["--version"],
-            operation="checking gcloud installation",
-            timeout=10,
-        )
+        mock_which.assert_called_once_with("gcloud")
 
-    @patch("google_docs_markdown.setup.gcloud_run")
-    def test_gcloud_not_installed(self, mock_gcloud_run: Mock) -> None:
+    @patch("google_docs_markdown.setup.shutil.which")
+    def test_gcloud_not_installed(self, mock_which: Mock) -> None:
         """Test when gcloud is not found."""
-        mock_gcloud_run.return_value = None
+        mock_which.return_value = None
         assert check_gcloud_installed() is False
 
 
+@pytest.fixture
+def adc_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point gcloud's config directory at *tmp_path* and create an ADC file there."""
+    monkeypatch.setenv("CLOUDSDK_CONFIG", str(tmp_path))
+    monkeypatch.delenv("GOOGLE_APPLICATION_CREDENTIALS", raising=False)
+    path = tmp_path / "application_default_credentials.json"
+    path.write_text("{}", encoding="utf-8")
+    return path
+
+
+@pytest.mark.usefixtures("adc_file")
 class TestCheckCredentialsExist:
     """Test credential existence check."""
 
+    @patch("google_docs_markdown.setup.default")
+    def test_no_adc_file_skips_lookup(self, mock_default: Mock, adc_file: Path) -> None:
+        """Test that a missing ADC file short-circuits without resolving credentials."""
+        adc_file.unlink()
+        assert check_credentials_exist() is False
+        mock_default.assert_not_called()
+
+    @patch("google_docs_markdown.setup.default")
+    def test_explicit_credentials_env_var(
+        self, mock_default: Mock, adc_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that GOOGLE_APPLICATION_CREDENTIALS is resolved even without the gcloud ADC file."""
+        adc_file.unlink()
+        monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", "/path/to/key.json")
+        mock_default.return_value = (Mock(), None)
+        assert check_credentials_exist() is True
+
     @patch("google_docs_markdown.setup.default")
     def test_credentials_exist(self, mock_default: Mock) -> None:
         """Test when credentials exist."""
@@ -60,6 +97,29 @@ class TestCheckCredentialsExist:
         assert check_credentials_exist() is True
         mock_default.assert_called_once_with(scopes=REQUIRED_SCOPES)
 
+    @patch("google_docs_markdown.setup.default")
+    def test_credentials_reused_within_ttl(self, mock_default: Mock) -> None:
+        """Test that resolved credentials are reused until the cache is cleared."""
+        mock_default.return_value = (Mock(), None)
+        assert check_credentials_exist() is True
+        assert check_credentials_exist() is True
+        mock_default.assert_called_once()
+
+        clear_setup_caches()
+        assert check_credentials_exist() is True
+        assert mock_default.call_count == 2
+
+    @patch("google_docs_markdown.setup.time.monotonic")
+    @patch("google_docs_markdown.setup.default")
+    def test_credentials_cache_expires(self, mock_default: Mock, mock_monotonic: Mock) -> None:
+        """Test that cached credentials are resolved again after ADC_CACHE_TTL."""
+        mock_default.return_value = (Mock(), None)
+        mock_monotonic.return_value = 1000.0
+        check_credentials_exist()
+        mock_monotonic.return_value = 1000.0 + ADC_CACHE_TTL + 1
+        check_credentials_exist()
+        assert mock_default.call_count == 2
+
     @patch("google_docs_markdown.setup.default")
     def test_credentials_not_exist(self, mock_default: Mock) -> None:
         """Test when credentials don't exist."""
@@ -85,6 +145,7 @@ class TestGetCurrentProject:
             ["config", "get-value", "project"],
             operation="getting current default GCP project",
             timeout=10,
+            cache=True,
         )
 
     @patch("google_docs_markdown.setup.gcloud_run")
@@ -113,8 +174,15 @@ class TestListAvailableProjects:
             ["projects", "list", "--format=value(projectId)"],
             operation="listing available GCP projects",
             timeout=30,
+            retries=READ_RETRIES,
         )
 
+    @patch("google_docs_markdown.setup.gcloud_run")
+    def test_list_projects_windows_line_endings(self, mock_gcloud_run: Mock) -> None:
+        """Test that CRLF output and blank lines are handled."""
+        mock_gcloud_run.return_value = "project-1\r\n\r\nproject-2\r\n"
+        assert list_available_projects() == ["project-1", "project-2"]
+
     @patch("google_docs_markdown.setup.gcloud_run")
     def test_list_projects_empty(self, mock_gcloud_run: Mock) -> None:
         """Test when no projects are available."""
@@ -140,6 +208,7 @@ class TestSetProject:
             ["config", "set", "project", "my-project-id"],
             operation="setting default GCP project to 'my-project-id'",
             timeout=10,
+            quiet=True,
         )
 
     @patch("google_docs_markdown.setup.gcloud_exec")
@@ -170,6 +239,83 @@ class TestCheckApiEnabled:
         mock_gcloud_run.return_value = None
         assert check_api_enabled("my-project") is False
 
+    @patch("google_docs_markdown.setup.gcloud_exec")
+    @patch("google_docs_markdown.setup.gcloud_run")
+    def test_enabled_by_this_process_skips_check(self, mock_gcloud_run: Mock, mock_gcloud_exec: Mock) -> None:
+        """Test that a project enabled in this process is not checked again."""
+        mock_gcloud_exec.return_value = True
+        assert enable_docs_api("my-project") is True
+
+        assert check_api_enabled("my-project") is True
+        mock_gcloud_run.assert_not_called()
+
+    @patch("google_docs_markdown.setup.gcloud_run")
+    def test_enabled_result_is_remembered(self, mock_gcloud_run: Mock) -> None:
+        """Test that only a positive answer is remembered until the caches are cleared."""
+        mock_gcloud_run.return_value = ""
+        assert check_api_enabled("my-project") is False
+        mock_gcloud_run.return_value = f"projects/my-project/services/{DOCS_API_SERVICE}"
+        assert check_api_enabled("my-project") is True
+        assert check_api_enabled("my-project") is True
+        assert mock_gcloud_run.call_count == 2
+
+        clear_setup_caches()
+        check_api_enabled("my-project")
+        assert mock_gcloud_run.call_count == 3
+
+    @pytest.mark.parametrize(("state", "expected"), [("ENABLED", True), ("DISABLED", False)])
+    @patch("googleapiclient.discovery.build")
+    @patch("google_docs_markdown.setup.gcloud_run")
+    def test_service_usage_api_answers(
+        self,
+        mock_gcloud_run: Mock,
+        mock_build: Mock,
+        no_application_default_credentials: Mock,
+        state: str,
+        expected: bool,
+    ) -> None:
+        """Test that a Service Usage API answer is used without running gcloud."""
+        no_application_default_credentials.side_effect = None
+        no_application_default_credentials.return_value = (Mock(), "my-project")
+        mock_build.return_value.services.return_value.get.return_value.execute.return_value = {"state": state}
+
+        assert check_api_enabled("my-project") is expected
+
+        mock_build.return_value.services.return_value.get.assert_called_once_with(
+            name=f"projects/my-project/services/{DOCS_API_SERVICE}"
+        )
+        mock_gcloud_run.assert_not_called()
+
+    @patch("googleapiclient.discovery.build")
+    @patch("google_docs_markdown.setup.gcloud_run")
+    def test_service_usage_api_error_falls_back_to_gcloud(
+        self, mock_gcloud_run: Mock, mock_build: Mock, no_application_default_credentials: Mock
+    ) -> None:
+        """Test that a failed Service Usage API request falls back to gcloud."""
+        no_application_default_credentials.side_effect = None
+        no_application_default_credentials.return_value = (Mock(), "my-project")
+        mock_build.return_value.services.return_value.get.return_value.execute.side_effect = HttpError(
+            Mock(status=403), b""
+        )
+        mock_gcloud_run.return_value = f"projects/my-project/services/{DOCS_API_SERVICE}"
+
+        assert check_api_enabled("my-project") is True
+        mock_gcloud_run.assert_called_once()
+
+    @patch("googleapiclient.discovery.build")
+    @patch("google_docs_markdown.setup.gcloud_run")
+    def test_service_usage_unexpected_error_is_raised(
+        self, mock_gcloud_run: Mock, mock_build: Mock, no_application_default_credentials: Mock
+    ) -> None:
+        """Test that errors other than auth, HTTP and network failures are not swallowed."""
+        no_application_default_credentials.side_effect = None
+        no_application_default_credentials.return_value = (Mock(), "my-project")
+        mock_build.return_value.services.return_value.get.return_value.execute.side_effect = KeyError("state")
+
+        with pytest.raises(KeyError):
+            check_api_enabled("my-project")
+        mock_gcloud_run.assert_not_called()
+
 
 class TestEnableDocsApi:
     """Test enabling Docs API."""
@@ -188,6 +334,7 @@ class TestEnableDocsApi:
             ],
             operation="enabling Google Docs API for project 'my-project'",
             timeout=60,
+            quiet=True,
         )
 
     @patch("google_docs_markdown.setup.gcloud_exec")
@@ -498,7 +645,7 @@ class TestSetup:
         mock_check_gcloud_installed.return_value = True
         mock_check_credentials_exist.return_value = False
         mock_get_current_project.return_value = "my-project"
-        # setup() directly calls gcloud_exec for auth login, not run_auth_login()
+        # setup() logs in via run_auth_login(), which calls gcloud_exec
         mock_gcloud_exec.return_value = True
         # setup() directly calls gcloud_run to check API
         mock_gcloud_run.return_value = f"projects/my-project/services/{DOCS_API_SERVICE}"
@@ -526,7 +673,7 @@ class TestSetup:
 
         mock_check_gcloud_installed.return_value = True
         mock_check_credentials_exist.return_value = False
-        # setup() directly calls gcloud_exec for auth login, which raises GCloudException on failure
+        # run_auth_login() calls gcloud_exec, which raises GCloudException on failure
         from google_docs_markdown.gcloud import GCloudException
 
         mock_gcloud_exec.side_effect = GCloudException(
@@ -601,6 +748,37 @@ class TestSetup:
         # Verify gcloud_run was called to check API
         assert mock_gcloud_run.call_count >= 2
 
+    def test_setup_no_project_out_of_range_number_reprompts(
+        self,
+        mock_check_gcloud_installed: Mock,
+        mock_check_credentials_exist: Mock,
+        mock_get_current_project: Mock,
+        mock_gcloud_run: Mock,
+        mock_gcloud_exec: Mock,
+        mock_typer_prompt: Mock,
+        mock_typer_echo: Mock,
+        mock_client_id_path_not_exists: tuple[Mock, MagicMock],
+    ) -> None:
+        """Test that an out-of-range number is rejected and the user is asked again."""
+        mock_gcloud_exec.reset_mock()
+        mock_gcloud_exec.side_effect = None
+        mock_typer_echo.reset_mock()
+        mock_check_gcloud_installed.return_value = True
+        mock_check_credentials_exist.return_value = True
+        mock_get_current_project.return_value = None
+        mock_gcloud_run.return_value = "project-1\nproject-2"
+        mock_typer_prompt.side_effect = ["3", "2"]
+        mock_gcloud_exec.return_value = True
+
+        try:
+            setup()
+        finally:
+            mock_typer_prompt.side_effect = None
+
+        mock_typer_echo.assert_any_call("Invalid choice: 3. Please try again.", err=True)
+        set_project_calls = [call for call in mock_gcloud_exec.call_args_list if call.args[0][:2] == ["config", "set"]]
+        assert set_project_calls[0].args[0] == ["config", "set", "project", "project-2"]
+
     def test_setup_no_projects_available(
         self,
         mock_check_gcloud_installed: Mock,
@@ -662,6 +840,43 @@ class TestSetup:
         ]
         assert len(enable_api_calls) > 0
 
+    def test_setup_api_check_error_continues_with_enable(
+        self,
+        mock_check_gcloud_installed: Mock,
+        mock_check_credentials_exist: Mock,
+        mock_get_current_project: Mock,
+        mock_gcloud_run: Mock,
+        mock_gcloud_exec: Mock,
+        mock_typer_echo: Mock,
+        mock_client_id_path_not_exists: tuple[Mock, MagicMock],
+    ) -> None:
+        """Test that a failed API check warns and still tries to enable the API."""
+        from google_docs_markdown.gcloud import GCloudException
+
+        mock_gcloud_exec.reset_mock()
+        mock_gcloud_exec.side_effect = None
+        mock_gcloud_run.reset_mock()
+        mock_typer_echo.reset_mock()
+
+        mock_check_gcloud_installed.return_value = True
+        mock_check_credentials_exist.return_value = True
+        mock_get_current_project.return_value = "my-project"
+        mock_gcloud_run.side_effect = GCloudException(
+            message="Permission denied",
+            operation="checking if Google Docs API is enabled",
+            command=["gcloud", "services", "list"],
+        )
+        mock_gcloud_exec.return_value = True
+
+        try:
+            setup()
+        finally:
+            mock_gcloud_run.side_effect = None
+
+        warnings = [c for c in mock_typer_echo.call_args_list if "Failed to check if API is enabled" in str(c)]
+        assert len(warnings) == 1
+        assert any(call.args[0][:2] == ["services", "enable"] for call in mock_gcloud_exec.call_args_list)
+
     def test_setup_enable_api_fails(
         self,
         mock_check_gcloud_installed: Mock,
@@ -780,7 +995,7 @@ class TestSetup:
         mock_get_current_project.return_value = "my-project"
         # setup() directly calls gcloud_run to check API
         mock_gcloud_run.return_value = f"projects/my-project/services/{DOCS_API_SERVICE}"
-        # setup() directly calls gcloud_exec for auth login
+        # setup() logs in via run_auth_login(), which calls gcloud_exec
         mock_gcloud_exec.return_value = True
 
         extra_scopes = "https://www.googleapis.com/auth/drive"
@@ -844,7 +1059,7 @@ class TestSetup:
         mock_get_current_project.return_value = "my-project"
         # setup() directly calls gcloud_run to check API
         mock_gcloud_run.return_value = f"projects/my-project/services/{DOCS_API_SERVICE}"
-        # setup() directly calls gcloud_exec for auth login
+        # setup() logs in via run_auth_login(), which calls gcloud_exec
         mock_gcloud_exec.return_value = True
 
         client_id_file = "/custom/path/client_id.json"
@@ -878,7 +1093,7 @@ class TestSetup:
         mock_get_current_project.return_value = "my-project"
         # setup() directly calls gcloud_run to check API
         mock_gcloud_run.return_value = f"projects/my-project/services/{DOCS_API_SERVICE}"
-        # setup() directly calls gcloud_exec for auth login
+        # setup() logs in via run_auth_login(), which calls gcloud_exec
         mock_gcloud_exec.return_value = True
 
         setup()
@@ -909,7 +1124,7 @@ class TestSetup:
         mock_get_current_project.return_value = "my-project"
         # setup() directly calls gcloud_run to check API
         mock_gcloud_run.return_value = f"projects/my-project/services/{DOCS_API_SERVICE}"
-        # setup() directly calls gcloud_exec for auth login
+        # setup() logs in via run_auth_login(), which calls gcloud_exec
         mock_gcloud_exec.return_value = True
 
         setup()
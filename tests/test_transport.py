@@ -7,16 +7,28 @@ Tests authentication, document retrieval, and error handling for the raw transpo
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 from unittest.mock import Mock, patch
 
 import pytest
 from google.auth.exceptions import DefaultCredentialsError
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.errors import HttpError
+from googleapiclient.http import DEFAULT_HTTP_TIMEOUT_SEC
 
+from google_docs_markdown import transport
 from google_docs_markdown.transport import (
+    DOCUMENT_CACHE_SIZE,
+    DOCUMENT_CACHE_TTL,
+    MAX_BATCH_SIZE,
+    MAX_REQUESTS_PER_UPDATE,
+    MAX_RETRIES,
     SCOPES,
+    CompactJsonModel,
     GoogleDocsTransport,
+    _extract_document_id,
 )
 
 if TYPE_CHECKING:
@@ -58,11 +70,60 @@ class TestExtractDocumentID:
         url = "https://docs.google.com/document/d/abc123def456/edit?usp=sharing"
         assert GoogleDocsTransport.extract_document_id(url) == "abc123def456"
 
+    def test_extract_from_id_query_param(self) -> None:
+        """Test extraction from a URL carrying the ID in an ``id=`` query parameter."""
+        url = "https://docs.google.com/open?id=abc123def456"
+        assert GoogleDocsTransport.extract_document_id(url) == "abc123def456"
+
     def test_extract_invalid_url(self) -> None:
         """Test that invalid URL raises ValueError."""
         with pytest.raises(ValueError, match="Could not extract document ID"):
             GoogleDocsTransport.extract_document_id("invalid")
 
+    def test_extract_is_memoized(self) -> None:
+        """Test that repeated extraction of the same input is served from the cache."""
+        url = "https://docs.google.com/document/d/memoized-doc-id/edit"
+        GoogleDocsTransport.extract_document_id(url)
+        hits_before = _extract_document_id.cache_info().hits
+
+        assert GoogleDocsTransport.extract_document_id(url) == "memoized-doc-id"
+        assert _extract_document_id.cache_info().hits == hits_before + 1
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://docs.google.com/document/d/abc-123_XYZ/edit?usp=sharing",
+            "https://docs.google.com/document/d/abc123def456",
+            "https://docs.google.com/document/d/abc123def456#heading=h.1",
+            "https://docs.google.com/open?id=first-id&x=/document/d/second-id",
+            "https://x/open?id=AAAAAAAAAA&u=/document/d/BBBBBBBBBB/edit",
+            "https://docs.google.com/document/d//document/d/abc123def456",
+        ],
+    )
+    def test_fast_path_matches_regex(self, url: str) -> None:
+        """Test that the plain-string scan agrees with the ordered regexes it replaces."""
+        matches = [m for m in (p.search(url) for p in transport._DOC_ID_PATTERNS) if m is not None]
+        assert matches
+        assert _extract_document_id(url) == matches[0].group(1)
+
+    def test_document_path_wins_over_id_param(self) -> None:
+        """Test that ``/document/d/ID`` takes precedence over an earlier ``id=`` parameter."""
+        url = "https://docs.google.com/open?id=first-id&x=/document/d/second-id"
+        assert _extract_document_id(url) == "second-id"
+
+    def test_id_param_before_document_path_keeps_original_result(self) -> None:
+        """Regression: an ``id=`` parameter ahead of ``/document/d/`` must not change which ID wins."""
+        url = "https://x/open?id=AAAAAAAAAA&u=/document/d/BBBBBBBBBB/edit"
+        assert GoogleDocsTransport.extract_document_id(url) == "BBBBBBBBBB"
+
+
+@pytest.fixture(autouse=True)
+def reset_transport_caches() -> Iterator[None]:
+    """Keep the process-wide ADC cache from leaking between tests."""
+    transport._cached_credentials = None
+    yield
+    transport._cached_credentials = None
+
 
 class TestAuthentication:
     """Test authentication handling."""
@@ -88,6 +149,16 @@ class TestAuthentication:
         with pytest.raises(DefaultCredentialsError, match="Failed to obtain"):
             client._get_credentials()
 
+    @patch("google.auth.default")
+    def test_get_credentials_is_cached_across_transports(self, mock_default: Any) -> None:
+        """Test that ADC is resolved once and shared by later transports."""
+        mock_creds = Mock()
+        mock_default.return_value = (mock_creds, None)
+
+        assert GoogleDocsTransport()._get_credentials() is mock_creds
+        assert GoogleDocsTransport()._get_credentials() is mock_creds
+        mock_default.assert_called_once()
+
     def test_custom_credentials(self) -> None:
         """Test using custom credentials."""
         mock_creds = Mock()
@@ -95,6 +166,48 @@ class TestAuthentication:
         assert client.credentials == mock_creds
 
 
+class TestBuildService:
+    """Test service construction."""
+
+    @patch("google_docs_markdown.transport.build")
+    def test_build_uses_transport_authorized_http(self, mock_build: Any) -> None:
+        """Test that the service is built on the transport's own long-lived AuthorizedHttp."""
+        mock_creds = Mock()
+        client = GoogleDocsTransport(credentials=mock_creds)
+
+        client._build_service()
+
+        assert isinstance(client._http, AuthorizedHttp)
+        assert client._http.credentials is mock_creds
+        assert client._http.http.timeout == DEFAULT_HTTP_TIMEOUT_SEC
+        assert 308 not in client._http.http.redirect_codes
+        for call in mock_build.call_args_list:
+            assert call.kwargs["http"] is client._http
+            assert call.kwargs["cache_discovery"] is False
+            assert call.kwargs["static_discovery"] is True
+            assert isinstance(call.kwargs["model"], CompactJsonModel)
+
+    @patch("google_docs_markdown.transport.build")
+    def test_http_is_not_shared_across_transports(self, mock_build: Any) -> None:
+        """Test that transports with the same credentials each get their own connection."""
+        mock_build.side_effect = lambda *args, **kwargs: Mock()
+        mock_creds = Mock()
+        first = GoogleDocsTransport(credentials=mock_creds)
+        second = GoogleDocsTransport(credentials=mock_creds)
+
+        assert first.service is not second.service
+        assert first._http is not second._http
+        assert mock_build.call_count == 2
+
+    def test_compact_json_model_omits_whitespace(self) -> None:
+        """Test that request bodies are serialized without separator padding."""
+        body = {"requests": [{"insertText": {"location": {"index": 1}, "text": "Hi, there: you"}}]}
+        encoded = CompactJsonModel().serialize(body)
+
+        assert encoded == '{"requests":[{"insertText":{"location":{"index":1},"text":"Hi, there: you"}}]}'
+        assert json.loads(encoded) == body
+
+
 class TestGetDocument:
     """Test document retrieval."""
 
@@ -112,7 +225,7 @@ class TestGetDocument:
 
         assert result["title"] == "Test Doc"
         mock_service.documents.return_value.get.assert_called_once_with(
-            documentId="test-doc-id", includeTabsContent=True
+            documentId="test-doc-id", includeTabsContent=True, fields=None
         )
 
     @patch("google_docs_markdown.transport.build")
@@ -130,7 +243,7 @@ class TestGetDocument:
 
         assert result["title"] == "Test Doc"
         mock_service.documents.return_value.get.assert_called_once_with(
-            documentId="test-doc-id", includeTabsContent=True
+            documentId="test-doc-id", includeTabsContent=True, fields=None
         )
 
     @patch("google_docs_markdown.transport.build")
@@ -170,7 +283,7 @@ class TestGetDocument:
         assert len(second_tab["childTabs"]) > 0
 
         mock_service.documents.return_value.get.assert_called_once_with(
-            documentId=example_doc["documentId"], includeTabsContent=True
+            documentId=example_doc["documentId"], includeTabsContent=True, fields=None
         )
 
     @patch("google_docs_markdown.transport.build")
@@ -272,3 +385,351 @@ class TestBatchUpdate:
         mock_service.documents.return_value.batchUpdate.assert_called_once_with(
             documentId="test-doc-id", body={"requests": requests}
         )
+
+
+class TestBatchUpdateChunking:
+    """Test splitting of oversized batch updates."""
+
+    @patch("google_docs_markdown.transport.build")
+    def test_large_update_is_split_in_order(self, mock_build: Any) -> None:
+        """Test that requests are sent in ordered chunks and replies concatenated."""
+        mock_service = Mock()
+        batch_update = mock_service.documents.return_value.batchUpdate
+
+        def execute_for(documentId: str, body: dict[str, Any]) -> Mock:
+            request = Mock()
+            request.execute.return_value = {"replies": [{"n": r["n"]} for r in body["requests"]]}
+            return request
+
+        batch_update.side_effect = execute_for
+        mock_build.return_value = mock_service
+
+        client = GoogleDocsTransport(credentials=Mock())
+        total = MAX_REQUESTS_PER_UPDATE * 2 + 1
+        requests = cast("list[Request]", [{"n": i} for i in range(total)])
+        result = client.batch_update("test-doc-id", requests)
+
+        sizes = [len(call.kwargs["body"]["requests"]) for call in batch_update.call_args_list]
+        assert sizes == [MAX_REQUESTS_PER_UPDATE, MAX_REQUESTS_PER_UPDATE, 1]
+        assert [r["n"] for r in cast("list[dict[str, int]]", result)] == list(range(total))
+
+
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that answers each sub-request via the callback.
+
+    A list response is consumed one item per execution, to simulate retries.
+    """
+
+    def __init__(self, callback: Any, responses: dict[str, Any]) -> None:
+        self.callback = callback
+        self.responses = responses
+        self.request_ids: list[str] = []
+
+    def add(self, request: Any, request_id: str) -> None:
+        self.request_ids.append(request_id)
+
+    def execute(self) -> None:
+        for request_id in self.request_ids:
+            response = self.responses[request_id]
+            if isinstance(response, list):
+                response = response.pop(0)
+            if isinstance(response, Exception):
+                self.callback(request_id, None, response)
+            else:
+                self.callback(request_id, response, None)
+
+
+def _mock_batch_service(mock_build: Any, responses: dict[str, Any]) -> list[FakeBatch]:
+    """Wire a mock service whose new_batch_http_request returns FakeBatch objects."""
+    batches: list[FakeBatch] = []
+
+    def new_batch(callback: Any) -> FakeBatch:
+        batch = FakeBatch(callback, responses)
+        batches.append(batch)
+        return batch
+
+    mock_service = Mock()
+    mock_service.new_batch_http_request.side_effect = new_batch
+    mock_build.return_value = mock_service
+    return batches
+
+
+class TestBatchRequests:
+    """Test batched multi-document operations."""
+
+    @patch("google_docs_markdown.transport.build")
+    def test_batch_get_documents(self, mock_build: Any) -> None:
+        """Test fetching several documents in one batch, deduplicating IDs."""
+        batches = _mock_batch_service(mock_build, {"doc-id-aaaaa": {"title": "A"}, "doc-id-bbbbb": {"title": "B"}})
+
+        client = GoogleDocsTransport(credentials=Mock())
+        result = client.batch_get_documents(
+            ["doc-id-aaaaa", "https://docs.google.com/document/d/doc-id-bbbbb/edit", "doc-id-aaaaa"]
+        )
+
+        assert result == {"doc-id-aaaaa": {"title": "A"}, "doc-id-bbbbb": {"title": "B"}}
+        assert len(batches) == 1
+        assert batches[0].request_ids == ["doc-id-aaaaa", "doc-id-bbbbb"]
+
+    @patch("google_docs_markdown.transport.build")
+    def test_batch_get_documents_chunks_large_batches(self, mock_build: Any) -> None:
+        """Test that more than MAX_BATCH_SIZE documents are split across batches."""
+        ids = [f"doc-id-{i:05d}" for i in range(MAX_BATCH_SIZE + 1)]
+        batches = _mock_batch_service(mock_build, {doc_id: {"documentId": doc_id} for doc_id in ids})
+
+        client = GoogleDocsTransport(credentials=Mock())
+        result = client.batch_get_documents(ids)
+
+        assert len(result) == len(ids)
+        assert [len(b.request_ids) for b in batches] == [MAX_BATCH_SIZE, 1]
+
+    @patch("google_docs_markdown.transport.build")
+    def test_batch_get_documents_raises_sub_request_error(self, mock_build: Any) -> None:
+        """Test that a failing sub-request is surfaced to the caller."""
+        _mock_batch_service(mock_build, {"doc-id-aaaaa": {"title": "A"}, "doc-id-bbbbb": RuntimeError("boom")})
+
+        client = GoogleDocsTransport(credentials=Mock())
+        with pytest.raises(RuntimeError, match="boom"):
+            client.batch_get_documents(["doc-id-aaaaa", "doc-id-bbbbb"])
+
+    @patch("google_docs_markdown.transport.time.sleep")
+    @patch("google_docs_markdown.transport.build")
+    def test_batch_retries_retryable_sub_requests(self, mock_build: Any, mock_sleep: Any) -> None:
+        """Test that only sub-requests failing with a retryable status are re-sent."""
+        unavailable = HttpError(Mock(status=503), b"")
+        batches = _mock_batch_service(
+            mock_build, {"doc-id-aaaaa": {"title": "A"}, "doc-id-bbbbb": [unavailable, {"title": "B"}]}
+        )
+
+        client = GoogleDocsTransport(credentials=Mock())
+        result = client.batch_get_documents(["doc-id-aaaaa", "doc-id-bbbbb"])
+
+        assert result == {"doc-id-aaaaa": {"title": "A"}, "doc-id-bbbbb": {"title": "B"}}
+        assert [b.request_ids for b in batches] == [["doc-id-aaaaa", "doc-id-bbbbb"], ["doc-id-bbbbb"]]
+        mock_sleep.assert_called_once()
+
+    @patch("google_docs_markdown.transport.time.sleep")
+    @patch("google_docs_markdown.transport.build")
+    def test_batch_gives_up_after_max_retries(self, mock_build: Any, mock_sleep: Any) -> None:
+        """Test that a persistently failing sub-request is raised after MAX_RETRIES retries."""
+        unavailable = HttpError(Mock(status=503), b"")
+        batches = _mock_batch_service(mock_build, {"doc-id-aaaaa": [unavailable] * (MAX_RETRIES + 1)})
+
+        client = GoogleDocsTransport(credentials=Mock())
+        with pytest.raises(HttpError):
+            client.batch_get_documents(["doc-id-aaaaa"])
+
+        assert len(batches) == MAX_RETRIES + 1
+        assert mock_sleep.call_count == MAX_RETRIES
+
+    @patch("google_docs_markdown.transport.build")
+    def test_batch_update_documents(self, mock_build: Any) -> None:
+        """Test batch updates across documents return each document's replies."""
+        _mock_batch_service(mock_build, {"doc-id-aaaaa": {"replies": [{}]}, "doc-id-bbbbb": {}})
+
+        client = GoogleDocsTransport(credentials=Mock())
+        requests: list[Request] = cast("list[Request]", [{"insertText": {"location": {"index": 1}, "text": "Hi"}}])
+        result = client.batch_update_documents({"doc-id-aaaaa": requests, "doc-id-bbbbb": requests})
+
+        assert result == {"doc-id-aaaaa": [{}], "doc-id-bbbbb": []}
+
+    @patch("google_docs_markdown.transport.build")
+    def test_batch_update_documents_splits_long_request_lists(self, mock_build: Any) -> None:
+        """Test that a long request list is sent as ordered chunks in consecutive batches."""
+        batches = _mock_batch_service(
+            mock_build,
+            {"doc-id-aaaaa": [{"replies": [{"n": 1}]}, {"replies": [{"n": 2}]}], "doc-id-bbbbb": {"replies": [{}]}},
+        )
+        long_requests = cast(
+            "list[Request]",
+            [{"insertText": {"location": {"index": 1}, "text": str(i)}} for i in range(MAX_REQUESTS_PER_UPDATE + 1)],
+        )
+        short_requests = long_requests[:1]
+
+        client = GoogleDocsTransport(credentials=Mock())
+        result = client.batch_update_documents({"doc-id-aaaaa": long_requests, "doc-id-bbbbb": short_requests})
+
+        assert result == {"doc-id-aaaaa": [{"n": 1}, {"n": 2}], "doc-id-bbbbb": [{}]}
+        assert [b.request_ids for b in batches] == [["doc-id-aaaaa", "doc-id-bbbbb"], ["doc-id-aaaaa"]]
+        batch_update = mock_build.return_value.documents.return_value.batchUpdate
+        sent = [c.kwargs["body"]["requests"] for c in batch_update.call_args_list]
+        split = MAX_REQUESTS_PER_UPDATE
+        assert sent == [long_requests[:split], short_requests, long_requests[split:]]
+
+
+class TestGetDocumentsParallel:
+    """Test concurrent multi-document retrieval."""
+
+    @patch("google_docs_markdown.transport.build")
+    def test_get_documents_parallel(self, mock_build: Any) -> None:
+        """Test that documents are fetched on per-thread HTTP objects and keyed in order."""
+        mock_service = Mock()
+
+        def get(documentId: str, includeTabsContent: bool, fields: str | None = None) -> Mock:
+            request = Mock()
+            request.execute.return_value = {"documentId": documentId}
+            return request
+
+        mock_service.documents.return_value.get.side_effect = get
+        mock_build.return_value = mock_service
+
+        client = GoogleDocsTransport(credentials=Mock())
+        ids = ["doc-id-aaaaa", "https://docs.google.com/document/d/doc-id-bbbbb/edit", "doc-id-ccccc"]
+        result = client.get_documents_parallel(ids, max_workers=2)
+
+        assert list(result) == ["doc-id-aaaaa", "doc-id-bbbbb", "doc-id-ccccc"]
+        assert result["doc-id-bbbbb"] == {"documentId": "doc-id-bbbbb"}
+
+    @patch("google_docs_markdown.transport.build")
+    def test_get_documents_parallel_passes_fields(self, mock_build: Any) -> None:
+        """Test that the field mask is applied to every parallel request."""
+        mock_service = Mock()
+        mock_build.return_value = mock_service
+
+        client = GoogleDocsTransport(credentials=Mock())
+        client.get_documents_parallel(["doc-id-aaaaa", "doc-id-bbbbb"], fields="title")
+
+        for get_call in mock_service.documents.return_value.get.call_args_list:
+            assert get_call.kwargs["fields"] == "title"
+
+    def test_thread_http_is_per_thread(self) -> None:
+        """Test that each thread gets its own AuthorizedHttp."""
+        import threading
+
+        client = GoogleDocsTransport(credentials=Mock())
+        main_http = client._thread_http()
+        assert client._thread_http() is main_http
+
+        other: list[AuthorizedHttp] = []
+        thread = threading.Thread(target=lambda: other.append(client._thread_http()))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not main_http
+
+
+class TestDocumentCache:
+    """Test reuse of recently fetched documents."""
+
+    @patch("google_docs_markdown.transport.build")
+    def test_repeated_get_document_hits_api_once(self, mock_build: Any) -> None:
+        """Test that a second fetch within the TTL is served from the cache."""
+        mock_service = Mock()
+        mock_service.documents.return_value.get.return_value.execute.return_value = {"title": "Test Doc"}
+        mock_build.return_value = mock_service
+
+        client = GoogleDocsTransport(credentials=Mock())
+        first = client.get_document("test-doc-id")
+        second = client.get_document("https://docs.google.com/document/d/test-doc-id/edit")
+
+        assert first == second
+        mock_service.documents.return_value.get.assert_called_once()
+
+    @patch("google_docs_markdown.transport.build")
+    def test_mutating_cache_hit_does_not_change_cache(self, mock_build: Any) -> None:
+        """Test that cache hits return a copy while a fresh fetch returns the response itself."""
+        response = {"title": "Test Doc"}
+        mock_service = Mock()
+        mock_service.documents.return_value.get.return_value.execute.return_value = response
+        mock_build.return_value = mock_service
+
+        client = GoogleDocsTransport(credentials=Mock())
+        assert client.get_document("test-doc-id") is response
+        client.get_document("test-doc-id")["title"] = "Changed"
+
+        assert client.get_document("test-doc-id")["title"] == "Test Doc"
+
+    @patch("google_docs_markdown.transport.build")
+    def test_cache_drops_least_recently_used(self, mock_build: Any) -> None:
+        """Test that the cache never holds more than DOCUMENT_CACHE_SIZE entries."""
+        mock_service = Mock()
+        mock_service.documents.return_value.get.return_value.execute.return_value = {"title": "Test Doc"}
+        mock_build.return_value = mock_service
+
+        client = GoogleDocsTransport(credentials=Mock())
+        client.get_document("document-0")
+        for i in range(1, DOCUMENT_CACHE_SIZE + 1):
+            client.get_document("document-0")
+            client.get_document(f"document-{i}")
+
+        assert len(client._document_cache) == DOCUMENT_CACHE_SIZE
+        assert ("document-0", None) in client._document_cache
+        assert ("document-1", None) not in client._document_cache
+
+    @patch("google_docs_markdown.transport.time.monotonic")
+    @patch("google_docs_markdown.transport.build")
+    def test_expired_entries_are_evicted_on_write(self, mock_build: Any, mock_monotonic: Any) -> None:
+        """Test that storing a new response drops entries past their TTL."""
+        mock_service = Mock()
+        mock_service.documents.return_value.get.return_value.execute.return_value = {"title": "Test Doc"}
+        mock_build.return_value = mock_service
+        mock_monotonic.side_effect = [0.0, DOCUMENT_CACHE_TTL + 1]
+
+        client = GoogleDocsTransport(credentials=Mock())
+        client.get_document("old-doc-id")
+        client.get_document("new-doc-id")
+
+        assert list(client._document_cache) == [("new-doc-id", None)]
+
+    @patch("google_docs_markdown.transport.build")
+    def test_field_masks_are_cached_separately(self, mock_build: Any) -> None:
+        """Test that a partial response is never served for a full-document request."""
+        mock_service = Mock()
+        mock_service.documents.return_value.get.return_value.execute.return_value = {"title": "Test Doc"}
+        mock_build.return_value = mock_service
+
+        client = GoogleDocsTransport(credentials=Mock())
+        client.get_document("test-doc-id", fields="title")
+        client.get_document("test-doc-id", fields="title")
+        client.get_document("test-doc-id")
+
+        get = mock_service.documents.return_value.get
+        assert get.call_count == 2
+        get.assert_any_call(documentId="test-doc-id", includeTabsContent=True, fields="title")
+
+    @patch("google_docs_markdown.transport.time.monotonic")
+    @patch("google_docs_markdown.transport.build")
+    def test_cache_expires_after_ttl(self, mock_build: Any, mock_monotonic: Any) -> None:
+        """Test that an expired entry is re-fetched."""
+        mock_service = Mock()
+        mock_service.documents.return_value.get.return_value.execute.return_value = {"title": "Test Doc"}
+        mock_build.return_value = mock_service
+        mock_monotonic.side_effect = [0.0, DOCUMENT_CACHE_TTL + 1, DOCUMENT_CACHE_TTL + 1]
+
+        client = GoogleDocsTransport(credentials=Mock())
+        client.get_document("test-doc-id")
+        client.get_document("test-doc-id")
+
+        assert mock_service.documents.return_value.get.call_count == 2
+
+    @patch("google_docs_markdown.transport.build")
+    def test_batch_update_invalidates_cache(self, mock_build: Any) -> None:
+        """Test that updating a document forces the next fetch to hit the API."""
+        mock_service = Mock()
+        mock_service.documents.return_value.get.return_value.execute.return_value = {"title": "Test Doc"}
+        mock_service.documents.return_value.batchUpdate.return_value.execute.return_value = {"replies": []}
+        mock_build.return_value = mock_service
+
+        client = GoogleDocsTransport(credentials=Mock())
+        client.get_document("test-doc-id")
+        client.batch_update("test-doc-id", [])
+        client.get_document("test-doc-id")
+
+        assert mock_service.documents.return_value.get.call_count == 2
+
+
+class TestDocumentsResource:
+    """Test reuse of the documents() collection."""
+
+    @patch("google_docs_markdown.transport.build")
+    def test_documents_collection_is_built_once(self, mock_build: Any) -> None:
+        """Test that repeated calls reuse a single documents() resource."""
+        mock_service = Mock()
+        mock_service.documents.return_value.batchUpdate.return_value.execute.return_value = {"replies": []}
+        mock_build.return_value = mock_service
+
+        client = GoogleDocsTransport(credentials=Mock())
+        client.batch_update("test-doc-id", [])
+        client.batch_update("test-doc-id", [])
+
+        mock_service.documents.assert_called_once_with()
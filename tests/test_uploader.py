@@ -84,7 +84,10 @@ class TestCreateFromMarkdown:
 
         requests = client.batch_update.call_args[0][1]
         insert_texts = [r for r in requests if r.insertText is not None]
-        assert len(insert_texts) >= 2
+        assert len(insert_texts) == 1
+        assert insert_texts[0].insertText is not None
+        assert insert_texts[0].insertText.text == "Heading 1\nSome text here.\n"
+        assert any(r.updateParagraphStyle is not None for r in requests)
 
     def test_bold_formatting(self) -> None:
         client = _mock_client()